@@ -8,9 +8,35 @@ import os
 import sys
 import shutil
 import subprocess
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
 
 
+# Sample configuration shipped with the package, kept as bytes so every
+# build writes a byte-identical file regardless of platform newlines
+_SAMPLE_CFG = (
+    b'{\n'
+    b'  "show_line_numbers": true,\n'
+    b'  "show_status_bar": true,\n'
+    b'  "show_scrollbar": true,\n'
+    b'  "tab_size": 4,\n'
+    b'  "use_spaces": true,\n'
+    b'  "line_ending": "CRLF",\n'
+    b'  "encoding": "utf-8",\n'
+    b'  "insert_mode": true,\n'
+    b'  "wrap_lines": false,\n'
+    b'  "retro_colors": true\n'
+    b'}\n'
+)
+
+# Lines of build output kept for the failure report
+OUTPUT_TAIL_LINES = 200
+
+# Below this many files, copying on the main thread beats pool startup
+PARALLEL_COPY_THRESHOLD = 16
+
+
 def check_dependencies():
     """Check if build dependencies are available"""
     try:
@@ -22,27 +48,90 @@ def check_dependencies():
         return False
 
 
+def _remove_tree_contents(path: str) -> None:
+    """Delete everything below path, using scandir's cached entry types instead of lstat"""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _remove_tree_contents(entry.path)
+                os.rmdir(entry.path)
+            else:
+                os.unlink(entry.path)
+
+
+def _fast_rmtree(path: Path) -> None:
+    """Remove a directory tree if it exists"""
+    try:
+        os.stat(path)
+    except FileNotFoundError:
+        return
+    
+    if sys.platform == "win32":
+        # rmdir /s is far faster than shutil.rmtree for many small files
+        subprocess.run(["cmd", "/c", "rmdir", "/s", "/q", str(path)], check=False)
+        if not path.exists():
+            return
+    
+    try:
+        _remove_tree_contents(str(path))
+        os.rmdir(path)
+    except OSError:
+        shutil.rmtree(path)
+
+
+def use_onefile() -> bool:
+    """Whether to produce a single-file executable instead of a onedir bundle"""
+    return os.environ.get("RETROEDIT_ONEFILE") == "1"
+
+
+def executable_name() -> str:
+    """Platform-specific executable file name"""
+    return "retroedit.exe" if sys.platform == "win32" else "retroedit"
+
+
+def run_streaming(cmd: list) -> None:
+    """Run a build command, echoing its output live.
+
+    Only the last OUTPUT_TAIL_LINES lines are kept; they are attached to the
+    CalledProcessError raised when the command fails.
+    """
+    tail = deque(maxlen=OUTPUT_TAIL_LINES)
+    with subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1
+    ) as proc:
+        for line in proc.stdout:
+            sys.stdout.write(line)
+            tail.append(line)
+    
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd, output="".join(tail))
+
+
 def build_with_pyinstaller():
     """Build using PyInstaller"""
-    print("Building with PyInstaller...")
+    onefile = use_onefile()
+    print(f"Building with PyInstaller ({'onefile' if onefile else 'onedir'})...")
     
     # Clean previous builds
-    if Path("dist").exists():
-        shutil.rmtree("dist")
-    if Path("build").exists():
-        shutil.rmtree("build")
+    _fast_rmtree(Path("dist"))
+    _fast_rmtree(Path("build"))
     
     # Build command
-    cmd = [
-        sys.executable, "-m", "PyInstaller",
-        "--onefile",
+    # Onedir bundles avoid unpacking everything to a temp directory on
+    # every launch; set RETROEDIT_ONEFILE=1 for a single-file artifact.
+    cmd = [sys.executable, "-m", "PyInstaller"]
+    if onefile:
+        cmd.append("--onefile")
+    else:
+        cmd.extend(["--onedir", "--contents-directory", "lib"])
+    cmd.extend([
         "--console",
         "--name", "retroedit",
-        "--add-data", "retroedit.tcss:.",
+        "--add-data", f"retroedit/retroedit.tcss{os.pathsep}retroedit",
         "--hidden-import", "retroedit",
         "--hidden-import", "retroedit.ui",
         "main.py"
-    ]
+    ])
     
     # Add platform-specific options
     if sys.platform == "win32":
@@ -51,23 +140,24 @@ def build_with_pyinstaller():
         cmd.extend(["--icon", "icon.icns"])
     
     try:
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+        run_streaming(cmd)
         print("✓ Build successful!")
         
         # Show output location
         dist_path = Path("dist")
-        if dist_path.exists():
-            executables = list(dist_path.glob("*"))
-            if executables:
-                print(f"Executable created: {executables[0]}")
+        if onefile:
+            exe_path = dist_path / executable_name()
+        else:
+            exe_path = dist_path / "retroedit" / executable_name()
+        if exe_path.exists():
+            print(f"Executable created: {exe_path}")
         
         return True
     except subprocess.CalledProcessError as e:
         print(f"✗ Build failed: {e}")
-        if e.stdout:
-            print("STDOUT:", e.stdout)
-        if e.stderr:
-            print("STDERR:", e.stderr)
+        if e.output:
+            print(f"Last {OUTPUT_TAIL_LINES} lines of output:")
+            print(e.output, end="")
         return False
 
 
@@ -90,30 +180,106 @@ def build_with_nuitka():
     ]
     
     try:
-        result = subprocess.run(cmd, check=True)
+        run_streaming(cmd)
         print("✓ Nuitka build successful!")
         return True
     except subprocess.CalledProcessError as e:
         print(f"✗ Nuitka build failed: {e}")
+        if e.output:
+            print(f"Last {OUTPUT_TAIL_LINES} lines of output:")
+            print(e.output, end="")
         return False
 
 
+def _fast_copy(src: Path, dst: Path) -> None:
+    """Copy file contents with the platform's kernel copy primitive.
+
+    Falls back to shutil.copyfile (which itself uses fcopyfile on macOS)
+    when the fast path is unavailable or fails.
+    """
+    src, dst = str(src), str(dst)
+    try:
+        if sys.platform == "win32":
+            import ctypes
+            copy_file2 = ctypes.windll.kernel32.CopyFile2
+            copy_file2.argtypes = (ctypes.c_wchar_p, ctypes.c_wchar_p, ctypes.c_void_p)
+            copy_file2.restype = ctypes.c_long
+            if copy_file2(src, dst, None) == 0:
+                return
+        elif sys.platform == "darwin":
+            import ctypes
+            libsystem = ctypes.CDLL("/usr/lib/libSystem.dylib", use_errno=True)
+            # clonefile refuses to overwrite an existing destination
+            if os.path.lexists(dst):
+                os.unlink(dst)
+            if libsystem.clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0:
+                return
+        elif hasattr(os, "sendfile"):
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+                while os.sendfile(out_fd, in_fd, None, 1 << 20):
+                    pass
+            return
+    except (OSError, AttributeError):
+        pass
+    shutil.copyfile(src, dst)
+
+
+def _copy_with_stat(src: Path, dst: Path) -> None:
+    """Copy a file and its metadata"""
+    _fast_copy(src, dst)
+    shutil.copystat(src, dst)
+
+
+def _collect_tree(src_dir: Path, dst_dir: Path, pairs: list) -> None:
+    """Recreate src_dir's directories under dst_dir and collect (src, dst) file pairs"""
+    dst_dir.mkdir(parents=True, exist_ok=True)
+    with os.scandir(src_dir) as entries:
+        for entry in entries:
+            dst = dst_dir / entry.name
+            if entry.is_symlink():
+                os.symlink(os.readlink(entry.path), dst)
+            elif entry.is_dir():
+                _collect_tree(Path(entry.path), dst, pairs)
+            else:
+                pairs.append((Path(entry.path), dst))
+
+
+def _copy_files(pairs: list) -> None:
+    """Copy (src, dst) pairs, overlapping I/O on a thread pool for wide trees"""
+    if len(pairs) <= PARALLEL_COPY_THRESHOLD:
+        for src, dst in pairs:
+            _copy_with_stat(src, dst)
+        return
+    
+    with ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 2) as pool:
+        futures = [pool.submit(_copy_with_stat, src, dst) for src, dst in pairs]
+        wait(futures)
+    for future in futures:
+        future.result()  # Re-raise the first copy error, if any
+
+
 def create_package():
     """Create a distributable package"""
     print("Creating package...")
     
     # Create package directory
     package_dir = Path("package")
-    if package_dir.exists():
-        shutil.rmtree(package_dir)
+    _fast_rmtree(package_dir)
     package_dir.mkdir()
     
     # Copy executable
     dist_path = Path("dist")
-    if dist_path.exists():
+    bundle_dir = dist_path / "retroedit"
+    if bundle_dir.is_dir():
+        pairs = []
+        _collect_tree(bundle_dir, package_dir / "retroedit", pairs)
+        _copy_files(pairs)
+        print(f"✓ Copied {bundle_dir.name}/ ({len(pairs)} files)")
+    elif dist_path.exists():
         for exe in dist_path.glob("*"):
             if exe.is_file():
-                shutil.copy2(exe, package_dir)
+                _copy_with_stat(exe, package_dir / exe.name)
                 print(f"✓ Copied {exe.name}")
     
     # Copy documentation
@@ -121,23 +287,12 @@ def create_package():
     for doc in docs:
         doc_path = Path(doc)
         if doc_path.exists():
-            shutil.copy2(doc_path, package_dir)
+            _copy_with_stat(doc_path, package_dir / doc_path.name)
             print(f"✓ Copied {doc}")
     
     # Create sample config
     sample_config = package_dir / "sample_config.json"
-    sample_config.write_text('''{
-  "show_line_numbers": true,
-  "show_status_bar": true,
-  "show_scrollbar": true,
-  "tab_size": 4,
-  "use_spaces": true,
-  "line_ending": "CRLF",
-  "encoding": "utf-8",
-  "insert_mode": true,
-  "wrap_lines": false,
-  "retro_colors": true
-}''')
+    sample_config.write_bytes(_SAMPLE_CFG)
     print("✓ Created sample configuration")
     
     print(f"Package created in: {package_dir}")
@@ -6,8 +6,6 @@ Main entry point for the application
 
 import sys
 import argparse
-from pathlib import Path
-from retroedit.app import RetroEditApp
 
 
 def main():
@@ -28,11 +26,15 @@ def main():
     
     args = parser.parse_args()
     
+    # Imported late so --help and argument errors don't pay for loading Textual
+    from retroedit.app import RetroEditApp
+    
     # Initialize the application
     app = RetroEditApp()
     
     # Open file if specified
     if args.file:
+        from pathlib import Path
         file_path = Path(args.file)
         if file_path.exists():
             app.open_file(file_path, encoding=args.encoding)
@@ -4,14 +4,30 @@ Release preparation script for RetroEdit
 Checks project status and prepares for release
 """
 
+import hashlib
+import json
+import os
+import re
 import subprocess
 import sys
+import time
+from importlib.metadata import PackageNotFoundError, version as _pkg_version
 from pathlib import Path
 
 
+# Interpreter of the project venv; invoking it directly needs no activation
+VENV_PY = Path("venv/bin/python") if os.name != "nt" else Path("venv/Scripts/python.exe")
+
+_VERSION_RE = re.compile(rb'^__version__\s*=\s*["\']([^"\']+)', re.M)
+
+# Results of slow probes are cached between runs
+CACHE_FILE = Path(".release_cache.json")
+CACHE_TTL = 3600
+
+
 def run_command(cmd, check=True):
-    """Run a shell command and return the result"""
-    result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+    """Run a command given as an argv list, without a shell, and return the result"""
+    result = subprocess.run(cmd, capture_output=True, text=True)
     if check and result.returncode != 0:
         print(f"Error running command: {cmd}")
         print(f"STDERR: {result.stderr}")
@@ -19,10 +35,67 @@ def run_command(cmd, check=True):
     return result
 
 
+def run_python(*args, check=False):
+    """Run the venv interpreter (or the current one if there is no venv)"""
+    python = str(VENV_PY) if VENV_PY.exists() else sys.executable
+    return run_command([python, *args], check=check)
+
+
+def _cache_get(key):
+    """Return a cached check result, or None if missing or expired"""
+    try:
+        with open(CACHE_FILE, 'r', encoding='utf-8') as f:
+            entry = json.load(f).get(key)
+    except (OSError, json.JSONDecodeError, AttributeError):
+        return None
+    
+    if not entry or time.time() - entry["ts"] > entry.get("ttl", CACHE_TTL):
+        return None
+    return entry["ok"]
+
+
+def _cache_set(key, ok, ttl=CACHE_TTL):
+    """Store a check result in the cache file"""
+    try:
+        with open(CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        cache = {}
+    
+    cache[key] = {"ok": ok, "ts": time.time(), "ttl": ttl}
+    try:
+        with open(CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, indent=2)
+    except OSError:
+        pass  # Caching is best effort
+
+
+def _stat_key(name, paths):
+    """Build a cache key from the interpreter and the mtimes/sizes of paths"""
+    digest = hashlib.sha1(str(VENV_PY.resolve() if VENV_PY.exists() else sys.executable).encode())
+    for path in sorted(paths):
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        digest.update(f"{path}:{st.st_mtime_ns}:{st.st_size}".encode())
+    return f"{name}:{digest.hexdigest()}"
+
+
+def _tree_files(*roots):
+    """List all files below the given directories"""
+    files = []
+    for root in roots:
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [d for d in dirnames if d != "__pycache__"]
+            files.extend(os.path.join(dirpath, name) for name in filenames)
+    return files
+
+
 def check_git_status():
     """Check if git repository is clean"""
     print("🔍 Checking Git status...")
-    result = run_command("git status --porcelain")
+    result = run_command(["git", "status", "--porcelain"])
     if result.stdout.strip():
         print("⚠️  Warning: Working directory is not clean")
         print(result.stdout)
@@ -33,16 +106,24 @@ def check_git_status():
 def check_tests():
     """Run tests to ensure everything works"""
     print("\n🧪 Running tests...")
+    key = _stat_key("tests", _tree_files("tests", "retroedit"))
+    if _cache_get(key):
+        print("✅ All tests passed (cached)")
+        return True
+    
     try:
-        result = run_command("source venv/bin/activate && python -m pytest tests/ -v", check=False)
+        result = run_python("-m", "pytest", "tests/", "-v")
         if result.returncode == 0:
             print("✅ All tests passed")
+            _cache_set(key, True)
         else:
             print("❌ Tests failed")
             return False
     except:
         print("⚠️  pytest not available, running basic import test...")
-        result = run_command("source venv/bin/activate && python -c 'from retroedit.app import RetroEditApp; print(\"Import successful\")'")
+        result = run_python(
+            "-c", "from retroedit.app import RetroEditApp; print('Import successful')", check=True
+        )
         print("✅ Basic import test passed")
     
     return True
@@ -51,7 +132,7 @@ def check_tests():
 def check_demo():
     """Run demo script"""
     print("\n🎮 Running demo script...")
-    result = run_command("source venv/bin/activate && python demo.py", check=False)
+    result = run_python("demo.py")
     if result.returncode == 0:
         print("✅ Demo script runs successfully")
         return True
@@ -64,10 +145,26 @@ def check_demo():
 def check_build():
     """Test build process"""
     print("\n🔨 Testing build process...")
+    metadata = [
+        str(path)
+        for pattern in ("lib/*/site-packages/PyInstaller-*.dist-info/METADATA",
+                        "Lib/site-packages/PyInstaller-*.dist-info/METADATA")
+        for path in Path("venv").glob(pattern)
+    ]
+    key = _stat_key("pyinstaller", metadata)
     try:
-        result = run_command("source venv/bin/activate && python -c 'import PyInstaller; print(\"PyInstaller available\")'", check=False)
-        if result.returncode == 0:
+        available = _cache_get(key)
+        if available is None:
+            result = run_python("-c", "import PyInstaller; print('PyInstaller available')")
+            available = result.returncode == 0
+            _cache_set(key, available)
+        
+        if available:
             print("✅ PyInstaller is available for building")
+            exe_name = "retroedit.exe" if sys.platform == "win32" else "retroedit"
+            exe_path = Path("dist") / "retroedit" / exe_name
+            if exe_path.exists():
+                print(f"✅ Existing build found: {exe_path}")
             return True
         else:
             print("⚠️  PyInstaller not available - install with: pip install pyinstaller")
@@ -81,24 +178,35 @@ def check_files():
     """Check that all required files exist"""
     print("\n📁 Checking required files...")
     
-    required_files = [
-        "README.md",
-        "LICENSE", 
-        "requirements.txt",
-        "setup.py",
-        "main.py",
-        "retroedit/__init__.py",
-        "retroedit/app.py",
-        "retroedit/main.py",
-        ".gitignore",
-        "CHANGELOG.md",
-        "CONTRIBUTING.md"
-    ]
+    # Grouped by directory so each directory is read once
+    required_files = {
+        ".": [
+            "README.md",
+            "LICENSE",
+            "requirements.txt",
+            "setup.py",
+            "main.py",
+            ".gitignore",
+            "CHANGELOG.md",
+            "CONTRIBUTING.md",
+        ],
+        "retroedit": [
+            "__init__.py",
+            "app.py",
+            "main.py",
+        ],
+    }
     
     missing_files = []
-    for file_path in required_files:
-        if not Path(file_path).exists():
-            missing_files.append(file_path)
+    for directory, names in required_files.items():
+        try:
+            with os.scandir(directory) as entries:
+                present = {entry.name for entry in entries}
+        except OSError:
+            present = set()
+        missing_files.extend(
+            str(Path(directory) / name) for name in names if name not in present
+        )
     
     if missing_files:
         print(f"❌ Missing files: {missing_files}")
@@ -112,19 +220,23 @@ def show_version_info():
     """Show version information"""
     print("\n📋 Version Information:")
     
-    # Get version from __init__.py
-    init_file = Path("retroedit/__init__.py")
-    if init_file.exists():
-        content = init_file.read_text()
-        for line in content.splitlines():
-            if line.startswith('__version__'):
-                print(f"  Package version: {line.split('=')[1].strip().strip('\"')}")
-                break
+    # Get version from the installed metadata, or __init__.py as a fallback
+    try:
+        version = _pkg_version("retroedit")
+    except PackageNotFoundError:
+        version = None
+        init_file = Path("retroedit/__init__.py")
+        if init_file.exists():
+            match = _VERSION_RE.search(init_file.read_bytes())
+            if match:
+                version = match.group(1).decode()
+    if version:
+        print(f"  Package version: {version}")
     
     # Get current git branch and commit
     try:
-        branch = run_command("git branch --show-current").stdout.strip()
-        commit = run_command("git rev-parse --short HEAD").stdout.strip()
+        branch = run_command(["git", "branch", "--show-current"]).stdout.strip()
+        commit = run_command(["git", "rev-parse", "--short", "HEAD"]).stdout.strip()
         print(f"  Git branch: {branch}")
         print(f"  Git commit: {commit}")
     except:
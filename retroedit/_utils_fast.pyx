@@ -0,0 +1,123 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled versions of the hottest helpers in retroedit.utils
+Each function behaves exactly like its pure Python counterpart
+"""
+
+
+def wrap_text(str text, Py_ssize_t width):
+    """
+    Wrap text to specified width, breaking at word boundaries when possible
+    """
+    cdef list source, lines, current_words
+    cdef str line, word
+    cdef Py_ssize_t longest = 0, current_len, need, size
+    
+    if not text:
+        return [""]
+    
+    source = text.splitlines()
+    for line in source:
+        if len(line) > longest:
+            longest = len(line)
+    if longest <= width:
+        return source
+    
+    lines = []
+    for line in source:
+        if len(line) <= width:
+            lines.append(line)
+            continue
+        
+        current_words = []
+        current_len = 0
+        for word in line.split():
+            size = len(word)
+            need = current_len + size + (1 if current_words else 0)
+            if need <= width:
+                current_words.append(word)
+                current_len = need
+                continue
+            
+            if current_words:
+                lines.append(" ".join(current_words))
+            
+            if size > width:
+                # Word is longer than width, break it
+                lines.extend([word[i:i + width] for i in range(0, size - width, width)])
+                word = word[-(size % width or width):]
+            current_words = [word]
+            current_len = len(word)
+        
+        if current_words:
+            lines.append(" ".join(current_words))
+    
+    return lines
+
+
+def find_matching_bracket(str text, Py_ssize_t pos):
+    """
+    Find matching bracket for the bracket at given position
+    Returns None if no matching bracket found
+    """
+    cdef Py_ssize_t n = len(text), i, count = 1
+    cdef Py_UCS4 char, target, c
+    
+    if pos >= n or pos < 0:
+        return None
+    
+    char = text[pos]
+    if char == '(' or char == '[' or char == '{':
+        # Find closing bracket
+        target = ')' if char == '(' else (']' if char == '[' else '}')
+        for i in range(pos + 1, n):
+            c = text[i]
+            if c == char:
+                count += 1
+            elif c == target:
+                count -= 1
+                if count == 0:
+                    return i
+    elif char == ')' or char == ']' or char == '}':
+        # Find opening bracket
+        target = '(' if char == ')' else ('[' if char == ']' else '{')
+        for i in range(pos - 1, -1, -1):
+            c = text[i]
+            if c == char:
+                count += 1
+            elif c == target:
+                count -= 1
+                if count == 0:
+                    return i
+    
+    return None
+
+
+def find_word_boundaries(str text, Py_ssize_t pos):
+    """
+    Find word boundaries around the given position
+    Returns (start, end) positions
+    """
+    cdef Py_ssize_t n = len(text), start, end
+    cdef Py_UCS4 c
+    
+    if pos >= n or pos < 0:
+        return pos, pos
+    
+    # Find start of word
+    start = pos
+    while start > 0:
+        c = text[start - 1]
+        if not (c.isalnum() or c == '_'):
+            break
+        start -= 1
+    
+    # Find end of word
+    end = pos
+    while end < n:
+        c = text[end]
+        if not (c.isalnum() or c == '_'):
+            break
+        end += 1
+    
+    return start, end
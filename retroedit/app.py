@@ -3,49 +3,45 @@ Main RetroEdit application
 Textual-based retro text editor inspired by MS-DOS Edit
 """
 
+from textual import events
 from textual.app import App, ComposeResult
-from textual.containers import Vertical
 from textual.binding import Binding
-from textual.widgets import Footer
 from textual.screen import Screen
+from textual.timer import Timer
+from functools import lru_cache
+from importlib import resources
 from pathlib import Path
-from typing import Optional
-import os
-import sys
+from typing import Optional, TYPE_CHECKING
 
 from .ui.menu import MenuBar, MenuAction
 from .ui.status import StatusBar
 from .ui.text_editor import TextEditor, EditorUpdate
-from .ui.dialogs import (
-    SaveAsDialog, FindReplaceDialog, GoToLineDialog, OpenFileDialog, DialogResult
-)
 from .config import config
 
+if TYPE_CHECKING:
+    # Dialogs are imported when first opened, keeping them off the startup path
+    from .ui.dialogs import DialogResult
 
+
+CSS_FILE_NAME = "retroedit.tcss"
+
+# Package directory as seen by the import system (a real directory in
+# development and installed runs, the bundle's data dir under PyInstaller)
+_MODULE_DIR = resources.files(__package__)
+
+# Seconds between status bar/title refreshes while the editor is updating (~60 Hz)
+STATUS_REFRESH_INTERVAL = 0.016
+
+
+@lru_cache(maxsize=1)
 def get_css_path() -> str:
-    """Get the path to the CSS file, handling both development and packaged versions"""
-    # Check if we're running in a PyInstaller bundle
-    if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
-        # PyInstaller bundle - look in the temporary directory
-        css_path = Path(sys._MEIPASS) / "retroedit.tcss"
-        if css_path.exists():
-            return str(css_path)
-        
-        # Fallback: look in the retroedit subdirectory
-        css_path = Path(sys._MEIPASS) / "retroedit" / "retroedit.tcss"
-        if css_path.exists():
+    """Get the path to the CSS file shipped inside the retroedit package"""
+    try:
+        css_path = _MODULE_DIR.joinpath(CSS_FILE_NAME)
+        if css_path.is_file():
             return str(css_path)
-    
-    # Development mode - look relative to this file
-    module_dir = Path(__file__).parent
-    css_path = module_dir.parent / "retroedit.tcss"
-    if css_path.exists():
-        return str(css_path)
-    
-    # Look in the same directory as this module
-    css_path = module_dir / "retroedit.tcss"
-    if css_path.exists():
-        return str(css_path)
+    except OSError:
+        pass
     
     # Fallback to default name (will use Textual's default styling)
     return ""
@@ -60,8 +56,25 @@ class RetroEditScreen(Screen):
         Binding("f10", "toggle_menu", "Menu"),
     ]
     
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Widget references, cached so per-keystroke updates skip the DOM query
+        self._editor: Optional[TextEditor] = None
+        self._status_bar: Optional[StatusBar] = None
+        # Editor state the status bar was last rendered for
+        self._last_status_key: Optional[tuple] = None
+        # (file_path, modified) the title was last rendered for
+        self._last_title_key: Optional[tuple] = None
+        # Editor updates are coalesced into one status/title refresh per frame
+        self._status_dirty = False
+        self._pending_timer: Optional[Timer] = None
+    
     def compose(self) -> ComposeResult:
         """Create the main layout"""
+        # textual.widgets loads widget modules on first access; importing
+        # Footer here keeps it off the `import retroedit.app` path
+        from textual.widgets import Footer
+        
         yield MenuBar(id="menu-bar")
         yield TextEditor(id="text-editor")
         if config.show_status_bar:
@@ -70,63 +83,90 @@ class RetroEditScreen(Screen):
     
     def on_mount(self) -> None:
         """Called when screen is mounted"""
+        self._editor = self.query_one("#text-editor", TextEditor)
+        if config.show_status_bar:
+            self._status_bar = self.query_one("#status-bar", StatusBar)
         self.title = "RetroEdit - Untitled"
         self._update_status_bar()
     
+    # Menu action -> screen method name, looked up once per click
+    _ACTIONS = {
+        "file_new": "action_new_file",
+        "file_open": "action_open_file",
+        "file_save": "action_save_file",
+        "file_save_as": "action_save_as_file",
+        "file_exit": "action_quit",
+        "view_status_bar": "action_toggle_status_bar",
+        "view_line_numbers": "action_toggle_line_numbers",
+        "help_about": "action_show_about",
+        "help_shortcuts": "action_show_shortcuts",
+    }
+    
+    # Menu action -> text editor method name
+    _EDITOR_ACTIONS = {
+        "edit_undo": "action_undo",
+        "edit_redo": "action_redo",
+        "edit_cut": "action_cut",
+        "edit_copy": "action_copy",
+        "edit_paste": "action_paste",
+        "edit_find": "action_find",
+        "edit_replace": "action_replace",
+        "edit_goto": "action_goto_line",
+    }
+    
+    # Parameterized actions "<prefix>_<value>": prefix -> (method name, value converter)
+    _PREFIX_ACTIONS = {
+        "view_line_ending": ("action_set_line_ending", str.upper),
+        "view_encoding": ("action_set_encoding", lambda v: v.replace("utf8", "utf-8")),
+        "view_theme": ("action_set_theme", str),
+    }
+    
     def on_menu_action(self, message: MenuAction) -> None:
         """Handle menu actions"""
         action = message.action
         
-        if action == "file_new":
-            self.action_new_file()
-        elif action == "file_open":
-            self.action_open_file()
-        elif action == "file_save":
-            self.action_save_file()
-        elif action == "file_save_as":
-            self.action_save_as_file()
-        elif action == "file_exit":
-            self.action_quit()
-        elif action == "edit_undo":
-            self._get_editor().action_undo()
-        elif action == "edit_redo":
-            self._get_editor().action_redo()
-        elif action == "edit_cut":
-            self._get_editor().action_cut()
-        elif action == "edit_copy":
-            self._get_editor().action_copy()
-        elif action == "edit_paste":
-            self._get_editor().action_paste()
-        elif action == "edit_find":
-            self._get_editor().action_find()
-        elif action == "edit_replace":
-            self._get_editor().action_replace()
-        elif action == "edit_goto":
-            self._get_editor().action_goto_line()
-        elif action == "view_status_bar":
-            self.action_toggle_status_bar()
-        elif action == "view_line_numbers":
-            self.action_toggle_line_numbers()
-        elif action.startswith("view_line_ending_"):
-            ending = action.split("_")[-1].upper()
-            self.action_set_line_ending(ending)
-        elif action.startswith("view_encoding_"):
-            encoding = action.split("_")[-1].replace("utf8", "utf-8")
-            self.action_set_encoding(encoding)
-        elif action.startswith("view_theme_"):
-            theme = action.split("_")[-1]
-            self.action_set_theme(theme)
-        elif action == "help_about":
-            self.action_show_about()
-        elif action == "help_shortcuts":
-            self.action_show_shortcuts()
+        method = self._ACTIONS.get(action)
+        if method:
+            getattr(self, method)()
+            return
+        
+        method = self._EDITOR_ACTIONS.get(action)
+        if method:
+            getattr(self._get_editor(), method)()
+            return
+        
+        prefix, _, value = action.rpartition("_")
+        entry = self._PREFIX_ACTIONS.get(prefix)
+        if entry:
+            method, convert = entry
+            getattr(self, method)(convert(value))
     
     def on_editor_update(self, message: EditorUpdate) -> None:
         """Handle editor updates"""
+        self._status_dirty = True
+        if self._pending_timer is None:
+            self._pending_timer = self.set_timer(STATUS_REFRESH_INTERVAL, self._flush_status)
+    
+    def on_resize(self, event: events.Resize) -> None:
+        """Refresh pending status immediately when the screen is resized"""
+        self._flush_status()
+    
+    def on_screen_resume(self, event: events.ScreenResume) -> None:
+        """Refresh pending status immediately when returning from a dialog"""
+        self._flush_status()
+    
+    def _flush_status(self) -> None:
+        """Refresh the status bar and title if an editor update is pending"""
+        if self._pending_timer is not None:
+            self._pending_timer.stop()
+            self._pending_timer = None
+        if not self._status_dirty:
+            return
+        self._status_dirty = False
         self._update_status_bar()
         self._update_title()
     
-    def on_dialog_result(self, message: DialogResult) -> None:
+    def on_dialog_result(self, message: "DialogResult") -> None:
         """Handle dialog results"""
         if not message.result:
             return
@@ -188,14 +228,13 @@ class RetroEditScreen(Screen):
     
     def _get_editor(self) -> TextEditor:
         """Get the text editor widget"""
-        return self.query_one("#text-editor", TextEditor)
+        if self._editor is None:
+            self._editor = self.query_one("#text-editor", TextEditor)
+        return self._editor
     
     def _get_status_bar(self) -> Optional[StatusBar]:
         """Get the status bar widget if visible"""
-        try:
-            return self.query_one("#status-bar", StatusBar)
-        except:
-            return None
+        return self._status_bar
     
     def _update_status_bar(self) -> None:
         """Update the status bar with current editor state"""
@@ -205,13 +244,23 @@ class RetroEditScreen(Screen):
         
         editor = self._get_editor()
         cursor_row, cursor_col = editor.get_cursor_position()
+        file_path = editor.get_file_path()
+        modified = editor.is_modified()
+        encoding = editor.get_encoding()
+        
+        # The status bar also renders the global insert mode and line ending
+        key = (file_path, cursor_row, cursor_col, modified, encoding,
+               config.insert_mode, config.line_ending)
+        if key == self._last_status_key:
+            return
+        self._last_status_key = key
         
         status_bar.update_status(
-            file_path=editor.get_file_path(),
+            file_path=file_path,
             cursor_row=cursor_row,
             cursor_col=cursor_col,
-            modified=editor.is_modified(),
-            encoding=editor.get_encoding()
+            modified=modified,
+            encoding=encoding
         )
     
     def _update_title(self) -> None:
@@ -220,6 +269,12 @@ class RetroEditScreen(Screen):
         file_path = editor.get_file_path()
         modified = editor.is_modified()
         
+        # Re-assigning an identical title still repaints the header
+        key = (file_path, modified)
+        if key == self._last_title_key:
+            return
+        self._last_title_key = key
+        
         if file_path:
             filename = file_path.name
         else:
@@ -248,6 +303,7 @@ class RetroEditScreen(Screen):
     
     def action_open_file(self) -> None:
         """Open a file"""
+        from .ui.dialogs import OpenFileDialog
         self.app.push_screen(OpenFileDialog())
     
     def action_save_file(self) -> None:
@@ -268,11 +324,20 @@ class RetroEditScreen(Screen):
         """Save file with new name"""
         editor = self._get_editor()
         current_path = editor.get_file_path()
+        from .ui.dialogs import SaveAsDialog
         self.app.push_screen(SaveAsDialog(current_path))
     
     def action_toggle_status_bar(self) -> None:
         """Toggle status bar visibility"""
         config.show_status_bar = not config.show_status_bar
+        # Status updates go only to the cached widget, so drop it while hidden
+        if config.show_status_bar:
+            status_bars = self.query("#status-bar")
+            self._status_bar = status_bars.first(StatusBar) if status_bars else None
+            self._last_status_key = None
+            self._update_status_bar()
+        else:
+            self._status_bar = None
         # In a full implementation, would need to recreate the layout
         self.app.notify(f"Status bar: {'On' if config.show_status_bar else 'Off'}")
     
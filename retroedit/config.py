@@ -3,8 +3,8 @@ Configuration management for RetroEdit
 Handles view options, encoding, tab settings, and other preferences
 """
 
-from dataclasses import dataclass
-from typing import Literal
+from dataclasses import asdict, dataclass, fields, replace
+from typing import Dict, Literal, Tuple
 import json
 from pathlib import Path
 
@@ -12,6 +12,16 @@ from pathlib import Path
 LineEnding = Literal["CR", "LF", "CRLF"]
 Encoding = Literal["utf-8", "cp437", "cp1252", "latin-1"]
 
+# Characters written for each line ending setting
+_LINE_ENDINGS = {
+    "CR": "\r",
+    "LF": "\n",
+    "CRLF": "\r\n"
+}
+
+# Parsed config files keyed by (path, mtime_ns); callers get copies
+_config_cache: Dict[Tuple[str, int], "RetroEditConfig"] = {}
+
 
 @dataclass
 class RetroEditConfig:
@@ -38,58 +48,49 @@ class RetroEditConfig:
     
     def save_to_file(self, path: Path) -> None:
         """Save configuration to a JSON file"""
-        config_dict = {
-            "show_line_numbers": self.show_line_numbers,
-            "show_status_bar": self.show_status_bar,
-            "show_scrollbar": self.show_scrollbar,
-            "tab_size": self.tab_size,
-            "use_spaces": self.use_spaces,
-            "line_ending": self.line_ending,
-            "encoding": self.encoding,
-            "insert_mode": self.insert_mode,
-            "wrap_lines": self.wrap_lines,
-            "retro_colors": self.retro_colors,
-            "black_background": self.black_background,
-        }
-        
         with open(path, 'w', encoding='utf-8') as f:
-            json.dump(config_dict, f, indent=2)
+            json.dump(asdict(self), f, indent=2)
+        
+        # Drop entries for the old contents of this file
+        key_path = str(path)
+        for key in [key for key in _config_cache if key[0] == key_path]:
+            del _config_cache[key]
     
     @classmethod
     def load_from_file(cls, path: Path) -> 'RetroEditConfig':
         """Load configuration from a JSON file"""
-        if not path.exists():
+        try:
+            key = (str(path), path.stat().st_mtime_ns)
+        except OSError:
             return cls()
         
+        cached = _config_cache.get(key)
+        if cached is not None:
+            return replace(cached)
+        
         try:
             with open(path, 'r', encoding='utf-8') as f:
                 config_dict = json.load(f)
             
-            return cls(
-                show_line_numbers=config_dict.get("show_line_numbers", True),
-                show_status_bar=config_dict.get("show_status_bar", True),
-                show_scrollbar=config_dict.get("show_scrollbar", True),
-                tab_size=config_dict.get("tab_size", 4),
-                use_spaces=config_dict.get("use_spaces", True),
-                line_ending=config_dict.get("line_ending", "CRLF"),
-                encoding=config_dict.get("encoding", "utf-8"),
-                insert_mode=config_dict.get("insert_mode", True),
-                wrap_lines=config_dict.get("wrap_lines", False),
-                retro_colors=config_dict.get("retro_colors", True),
-                black_background=config_dict.get("black_background", True),
-            )
+            # Unknown keys (from newer or older versions) are ignored and
+            # missing ones keep their defaults
+            loaded = cls(**{
+                name: value for name, value in config_dict.items() if name in _FIELD_NAMES
+            })
         except (json.JSONDecodeError, KeyError):
             # Return default config if file is corrupted
             return cls()
+        
+        _config_cache[key] = loaded
+        return replace(loaded)
     
     def get_line_ending_chars(self) -> str:
         """Get the actual line ending characters"""
-        endings = {
-            "CR": "\r",
-            "LF": "\n", 
-            "CRLF": "\r\n"
-        }
-        return endings[self.line_ending]
+        return _LINE_ENDINGS[self.line_ending]
+
+
+# Keys accepted when loading a config file
+_FIELD_NAMES = frozenset(field.name for field in fields(RetroEditConfig))
 
 
 # Global config instance
@@ -3,26 +3,39 @@ Core editor functionality for RetroEdit
 Handles text buffer, cursor navigation, and text operations
 """
 
-from typing import List, Tuple, Optional
+from collections import deque
+from typing import Deque, Dict, List, Set, Tuple, Optional
 from pathlib import Path
 from .config import config
-from .fileio import load_file, save_file
+from .fileio import load_lines, save_file
+from .search import BMHSearcher
+
+
+# Distinct search patterns whose preprocessed searchers are kept
+SEARCHER_CACHE_SIZE = 16
+
+# Undo/redo history depth
+UNDO_LIMIT = 50
+
+# (kind, data, cursor_row, cursor_col); kind is "splice" or "lines"
+UndoRecord = Tuple[str, object, int, int]
 
 
 class TextBuffer:
     """Text buffer with undo/redo support"""
     
     def __init__(self):
-        self.lines: List[str] = [""]
+        self._lines: List[str] = [""]
+        self._reset_char_set()
         self.cursor_row: int = 0
         self.cursor_col: int = 0
         self.modified: bool = False
         self.file_path: Optional[Path] = None
         self.encoding: str = "utf-8"
         
-        # Undo/Redo stacks (simple implementation)
-        self.undo_stack: List[Tuple[List[str], int, int]] = []
-        self.redo_stack: List[Tuple[List[str], int, int]] = []
+        # Undo/Redo stacks of records describing only the lines an edit touched
+        self.undo_stack: Deque[UndoRecord] = deque(maxlen=UNDO_LIMIT)
+        self.redo_stack: Deque[UndoRecord] = deque(maxlen=UNDO_LIMIT)
         
         # Selection
         self.selection_start: Optional[Tuple[int, int]] = None
@@ -31,38 +44,92 @@ class TextBuffer:
         # Find/Replace
         self.last_search: str = ""
         self.last_replace: str = ""
+        self._searcher_cache: Dict[Tuple[str, bool], BMHSearcher] = {}
     
-    def save_state(self):
-        """Save current state for undo"""
-        if len(self.undo_stack) > 50:  # Limit undo history
-            self.undo_stack.pop(0)
-        
-        self.undo_stack.append((
-            [line for line in self.lines],  # Deep copy of lines
-            self.cursor_row,
-            self.cursor_col
-        ))
+    @property
+    def lines(self) -> List[str]:
+        """Lines of text; assigning a new list is recorded as one undoable edit"""
+        return self._lines
+    
+    @lines.setter
+    def lines(self, lines: List[str]) -> None:
+        # Undo records hold line-level diffs against the current list, so a
+        # wholesale replacement is itself recorded as a whole-buffer splice;
+        # undoing it restores the old lines before older records replay
+        if lines != self._lines:
+            self._record_splice(0, len(self._lines), len(lines))
+        else:
+            self._reset_char_set()
+        self._lines = lines
+    
+    def _reset_char_set(self) -> None:
+        """Drop the buffer's character set after its text changed"""
+        # Characters present in the buffer, built by _may_contain
+        self._char_set: Optional[Set[str]] = None
+        # Whether a search has run since the last change; only a repeated
+        # search pays for building the set
+        self._char_set_wanted = False
+    
+    def _push_undo(self, record: UndoRecord) -> None:
+        """Push an undo record taken before an edit"""
+        self.undo_stack.append(record)  # Oldest record is evicted at the limit
+        self._reset_char_set()
         self.redo_stack.clear()  # Clear redo stack when new action is performed
     
-    def undo(self) -> bool:
-        """Undo last operation"""
-        if not self.undo_stack:
-            return False
-        
-        # Save current state to redo stack
-        self.redo_stack.append((
-            [line for line in self.lines],
+    def _record_splice(self, start: int, count: int, new_count: int) -> None:
+        """Record that lines[start:start + count] will become new_count lines"""
+        self._push_undo((
+            "splice",
+            (start, self.lines[start:start + count], new_count),
             self.cursor_row,
             self.cursor_col
         ))
-        
-        # Restore previous state
-        lines, row, col = self.undo_stack.pop()
-        self.lines = lines
+    
+    def _record_line_edit(self, row: int) -> None:
+        """Record that a single line is about to change in place"""
+        self._record_splice(row, 1, 1)
+    
+    def _record_line_insert(self, row: int) -> None:
+        """Record that the line at row is about to be split in two"""
+        self._record_splice(row, 1, 2)
+    
+    def _record_line_delete(self, row: int) -> None:
+        """Record that the line at row is about to be merged into its predecessor"""
+        self._record_splice(row - 1, 2, 1)
+    
+    def _record_multi(self, edits: List[Tuple[int, str]]) -> None:
+        """Record in-place edits of scattered lines as (row, old_text) pairs"""
+        self._push_undo(("lines", edits, self.cursor_row, self.cursor_col))
+    
+    def _apply_record(self, record: UndoRecord) -> UndoRecord:
+        """Apply an undo record and return the record that reverses it"""
+        kind, data, row, col = record
+        
+        if kind == "splice":
+            start, old_lines, new_count = data
+            current = self.lines[start:start + new_count]
+            self.lines[start:start + new_count] = old_lines
+            data = (start, current, len(old_lines))
+        else:
+            lines = self.lines
+            current = [(r, lines[r]) for r, _ in data]
+            for r, text in data:
+                lines[r] = text
+            data = current
+        
+        inverse = (kind, data, self.cursor_row, self.cursor_col)
+        self._reset_char_set()
         self.cursor_row = row
         self.cursor_col = col
         self.modified = True
+        return inverse
+    
+    def undo(self) -> bool:
+        """Undo last operation"""
+        if not self.undo_stack:
+            return False
         
+        self.redo_stack.append(self._apply_record(self.undo_stack.pop()))
         return True
     
     def redo(self) -> bool:
@@ -70,27 +137,16 @@ class TextBuffer:
         if not self.redo_stack:
             return False
         
-        # Save current state to undo stack
-        self.undo_stack.append((
-            [line for line in self.lines],
-            self.cursor_row,
-            self.cursor_col
-        ))
-        
-        # Restore redo state
-        lines, row, col = self.redo_stack.pop()
-        self.lines = lines
-        self.cursor_row = row
-        self.cursor_col = col
-        self.modified = True
-        
+        self.undo_stack.append(self._apply_record(self.redo_stack.pop()))
         return True
     
     def load_file(self, file_path: Path, encoding: Optional[str] = None) -> None:
         """Load a file into the buffer"""
-        content, detected_encoding = load_file(file_path, encoding)
-        
-        self.lines = content.splitlines() or [""]
+        # The file is decoded and split in chunks, never held as one string.
+        # The history is cleared below, so the lines setter's undo record
+        # (and its comparison with the old lines) is skipped.
+        self._lines, detected_encoding = load_lines(file_path, encoding)
+        self._reset_char_set()
         self.file_path = file_path
         self.encoding = detected_encoding
         self.cursor_row = 0
@@ -107,8 +163,8 @@ class TextBuffer:
         if file_path is None:
             raise ValueError("No file path specified")
         
-        content = '\n'.join(self.lines)
-        save_file(file_path, content, self.encoding)
+        # Lines are streamed to disk rather than joined into one string
+        save_file(file_path, self.lines, self.encoding)
         
         self.file_path = file_path
         self.modified = False
@@ -168,27 +224,52 @@ class TextBuffer:
     
     def insert_char(self, char: str) -> None:
         """Insert a character at cursor position"""
-        self.save_state()
+        self._record_line_edit(self.cursor_row)
         
-        current_line = list(self.get_current_line())
+        line = self.get_current_line()
+        col = self.cursor_col
         
-        if config.insert_mode:
+        if col >= len(line):
+            # Typing at end of line is the same in both modes
+            line += char
+        elif config.insert_mode:
             # Insert mode
-            current_line.insert(self.cursor_col, char)
+            line = line[:col] + char + line[col:]
         else:
             # Overwrite mode
-            if self.cursor_col < len(current_line):
-                current_line[self.cursor_col] = char
-            else:
-                current_line.append(char)
+            line = line[:col] + char + line[col + 1:]
         
-        self.lines[self.cursor_row] = ''.join(current_line)
+        self.lines[self.cursor_row] = line
         self.cursor_col += 1
         self.modified = True
     
+    def insert_text(self, text: str) -> None:
+        """Insert a string at cursor position as a single undoable edit"""
+        if not text:
+            return
+        
+        row, col = self.cursor_row, self.cursor_col
+        line = self.get_current_line()
+        pieces = text.split('\n')
+        self._record_splice(row, 1, len(pieces))
+        
+        if len(pieces) == 1 and not config.insert_mode:
+            # Overwrite mode replaces as many characters as were typed
+            tail = line[col + len(text):]
+        else:
+            tail = line[col:]
+        
+        pieces[0] = line[:col] + pieces[0]
+        self.cursor_row = row + len(pieces) - 1
+        self.cursor_col = len(pieces[-1])
+        pieces[-1] += tail
+        
+        self.lines[row:row + 1] = pieces
+        self.modified = True
+    
     def insert_newline(self) -> None:
         """Insert a new line at cursor position"""
-        self.save_state()
+        self._record_line_insert(self.cursor_row)
         
         current_line = self.get_current_line()
         
@@ -207,16 +288,16 @@ class TextBuffer:
     
     def delete_char(self) -> None:
         """Delete character at cursor position (Delete key)"""
-        self.save_state()
-        
         current_line = self.get_current_line()
         
         if self.cursor_col < len(current_line):
             # Delete character at cursor
+            self._record_line_edit(self.cursor_row)
             new_line = current_line[:self.cursor_col] + current_line[self.cursor_col + 1:]
             self.lines[self.cursor_row] = new_line
         elif self.cursor_row < len(self.lines) - 1:
             # Delete line break (merge with next line)
+            self._record_line_delete(self.cursor_row + 1)
             next_line = self.get_line(self.cursor_row + 1)
             self.lines[self.cursor_row] = current_line + next_line
             self.lines.pop(self.cursor_row + 1)
@@ -251,25 +332,18 @@ class TextBuffer:
             # Single line selection
             return self.get_line(start_row)[start_col:end_col]
         else:
-            # Multi-line selection
-            result = []
-            for row in range(start_row, end_row + 1):
-                line = self.get_line(row)
-                if row == start_row:
-                    result.append(line[start_col:])
-                elif row == end_row:
-                    result.append(line[:end_col])
-                else:
-                    result.append(line)
-            return '\n'.join(result)
+            # Multi-line selection; inner lines are taken whole with one slice
+            return '\n'.join([
+                self.get_line(start_row)[start_col:],
+                *self.lines[start_row + 1:end_row],
+                self.get_line(end_row)[:end_col],
+            ])
     
     def delete_selected_text(self) -> None:
         """Delete currently selected text"""
         if not self.selection_start or not self.selection_end:
             return
         
-        self.save_state()
-        
         start_row, start_col = self.selection_start
         end_row, end_col = self.selection_end
         
@@ -277,6 +351,9 @@ class TextBuffer:
         if (start_row > end_row) or (start_row == end_row and start_col > end_col):
             start_row, start_col, end_row, end_col = end_row, end_col, start_row, start_col
         
+        last_row = min(end_row, len(self.lines) - 1)
+        self._record_splice(start_row, last_row - start_row + 1, 1)
+        
         if start_row == end_row:
             # Single line deletion
             line = self.get_line(start_row)
@@ -291,9 +368,7 @@ class TextBuffer:
             self.lines[start_row] = start_line + end_line
             
             # Remove lines in between
-            for _ in range(start_row + 1, end_row + 1):
-                if start_row + 1 < len(self.lines):
-                    self.lines.pop(start_row + 1)
+            del self.lines[start_row + 1:end_row + 1]
         
         # Set cursor to start of selection
         self.cursor_row = start_row
@@ -302,59 +377,94 @@ class TextBuffer:
         self.selection_end = None
         self.modified = True
     
-    def find_text(self, search_text: str, start_pos: Optional[Tuple[int, int]] = None) -> Optional[Tuple[int, int]]:
+    def _get_searcher(self, search_text: str, case_sensitive: bool) -> BMHSearcher:
+        """Get a searcher for the pattern, building it only on first use"""
+        key = (search_text, case_sensitive)
+        searcher = self._searcher_cache.get(key)
+        if searcher is None:
+            if len(self._searcher_cache) >= SEARCHER_CACHE_SIZE:
+                self._searcher_cache.clear()
+            searcher = self._searcher_cache[key] = BMHSearcher(search_text, case_sensitive)
+        self.last_search = search_text
+        return searcher
+    
+    def _may_contain(self, search_text: str) -> bool:
+        """Cheap check that every character of search_text occurs in the buffer"""
+        # Edits and line list assignments reset the set. Building it is a
+        # full pass over the buffer, as costly as the search it guards, so
+        # the first search after a change goes ahead without it.
+        if self._char_set is None:
+            if not self._char_set_wanted:
+                self._char_set_wanted = True
+                return True
+            self._char_set = set().union(*self._lines)
+        return self._char_set.issuperset(search_text)
+    
+    def find_text(self, search_text: str, start_pos: Optional[Tuple[int, int]] = None,
+                  case_sensitive: bool = True) -> Optional[Tuple[int, int]]:
         """Find text in buffer starting from given position"""
         if not search_text:
             return None
         
+        searcher = self._get_searcher(search_text, case_sensitive)
+        if case_sensitive and not self._may_contain(search_text):
+            return None
         start_row, start_col = start_pos or (self.cursor_row, self.cursor_col)
         
-        # Search from current position to end of buffer
-        for row in range(start_row, len(self.lines)):
-            line = self.get_line(row)
-            col_start = start_col if row == start_row else 0
-            
-            pos = line.find(search_text, col_start)
+        # Walk every line once from the start row, wrapping around to end on
+        # the start row again where only matches before start_col count
+        lines = self.lines
+        n = len(lines)
+        wrap_limit = start_col + len(search_text) - 1
+        for i in range(n + 1):
+            row = (start_row + i) % n
+            if i == 0:
+                pos = searcher.find(lines[row], start_col)
+            elif i == n:
+                pos = searcher.find(lines[row], 0, wrap_limit)
+            else:
+                pos = searcher.find(lines[row])
             if pos >= 0:
                 return (row, pos)
         
-        # Search from beginning to current position (wrap around)
-        for row in range(0, start_row + 1):
-            line = self.get_line(row)
-            col_end = start_col if row == start_row else len(line)
-            
-            pos = line.find(search_text, 0)
-            if pos >= 0 and pos < col_end:
-                return (row, pos)
-        
         return None
     
-    def replace_text(self, search_text: str, replace_text: str, replace_all: bool = False) -> int:
+    def replace_text(self, search_text: str, replace_text: str, replace_all: bool = False,
+                     case_sensitive: bool = True) -> int:
         """Replace text in buffer. Returns number of replacements made."""
         if not search_text:
             return 0
         
         replacements = 0
+        searcher = self._get_searcher(search_text, case_sensitive)
+        self.last_replace = replace_text
+        if case_sensitive and not self._may_contain(search_text):
+            return 0
         
         if replace_all:
-            # Replace all occurrences
-            for row in range(len(self.lines)):
-                line = self.lines[row]
-                if search_text in line:
-                    self.lines[row] = line.replace(search_text, replace_text)
-                    replacements += line.count(search_text)
+            # Replace all occurrences, counting them in the same pass
+            lines = self.lines
+            edits = []
+            for row, line in enumerate(lines):
+                new_line, count = searcher.replace_in_line(line, replace_text)
+                if count:
+                    edits.append((row, line))
+                    lines[row] = new_line
+                    replacements += count
+            if edits:
+                self._record_multi(edits)
         else:
             # Replace current occurrence
-            pos = self.find_text(search_text)
+            pos = self.find_text(search_text, case_sensitive=case_sensitive)
             if pos:
                 row, col = pos
+                self._record_line_edit(row)
                 line = self.get_line(row)
                 new_line = line[:col] + replace_text + line[col + len(search_text):]
                 self.lines[row] = new_line
                 replacements = 1
         
         if replacements > 0:
-            self.save_state()
             self.modified = True
         
         return replacements
@@ -3,67 +3,351 @@ File I/O operations for RetroEdit
 Handles file loading/saving with encoding detection and conversion
 """
 
-import chardet
+import codecs
+import mmap
+import os
+import shutil
+import sys
+from contextlib import contextmanager
+from functools import partial
 from pathlib import Path
-from typing import Tuple, Optional
+from stat import S_ISREG
+from typing import BinaryIO, Callable, Dict, Iterable, Iterator, List, Tuple, Optional, Union
 from .config import config
+from .utils import normalize_line_endings
+
+
+# Statistical detector, imported on the first file that needs one
+_detector: Optional[Callable[[bytes], Optional[str]]] = None
+
+# Encoding detection reads the file in chunks of this size, stopping at the
+# first confident result or once the limit is reached
+ENCODING_DETECT_CHUNK = 64 * 1024
+ENCODING_DETECT_LIMIT = 1024 * 1024
+
+# Files at least this large are memory-mapped for loading instead of read
+MMAP_THRESHOLD = 4 * 1024 * 1024
+
+# Loading into lines decodes the file in chunks of this size, so only one
+# chunk of raw bytes is held at a time
+LOAD_CHUNK_SIZE = 64 * 1024
+
+# Write buffer for saves; streamed lines reach the OS in 1 MiB writes
+IO_BUFFER_SIZE = 1 << 20
+
+# Detected encodings keyed by (path, mtime_ns, size); a changed file gets a new key
+ENCODING_CACHE_SIZE = 128
+_encoding_cache: Dict[Tuple[str, int, int], str] = {}
+
+
+# Byte order marks identify an encoding outright. UTF-32 LE is listed before
+# UTF-16 LE because its BOM starts with the UTF-16 LE one.
+_BOMS = (
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+# Detector names that map to a more useful codec for editing
+_ENCODING_ALIASES = {
+    "ascii": "utf-8",
+}
+
+
+def _normalize_encoding(encoding: str) -> str:
+    """Lower-case a detector's encoding name and apply aliases"""
+    encoding = encoding.lower().replace("_", "-")
+    return _ENCODING_ALIASES.get(encoding, encoding)
+
+
+def _load_detector() -> Callable[[bytes], Optional[str]]:
+    """
+    Import the fastest available statistical detector
+    Faster C detectors are used when installed (pip install retroedit[fast])
+    """
+    global _detector
+    
+    try:
+        import cchardet
+        
+        def detect(raw: bytes) -> Optional[str]:
+            encoding = cchardet.detect(raw)['encoding']
+            return _normalize_encoding(encoding) if encoding else None
+    except ImportError:
+        try:
+            import charset_normalizer
+            
+            def detect(raw: bytes) -> Optional[str]:
+                match = charset_normalizer.from_bytes(raw).best()
+                return _normalize_encoding(match.encoding) if match else None
+        except ImportError:
+            import chardet
+            
+            def detect(raw: bytes) -> Optional[str]:
+                result = chardet.detect(raw)
+                encoding = result['encoding']
+                if encoding and result['confidence'] > 0.7:
+                    return _normalize_encoding(encoding)
+                return None
+    
+    _detector = detect
+    return detect
+
+
+def _detect_bytes(raw: bytes) -> Optional[str]:
+    """
+    Detect the encoding of raw bytes with the fastest available detector
+    Returns None if no detector is confident
+    """
+    for bom, encoding in _BOMS:
+        if raw.startswith(bom):
+            return encoding
+    
+    # Pure ASCII is valid UTF-8; bytes.isascii() checks it in one C pass
+    if raw.isascii():
+        return 'utf-8'
+    
+    # BOM and ASCII files are settled above without importing a detector
+    detect = _detector or _load_detector()
+    return detect(raw)
+
+
+def _detect_chunks(chunks: Iterable[bytes]) -> str:
+    """
+    Detect the encoding from successive chunks of a file
+    Usually the first chunk decides; only ambiguous text consumes more
+    """
+    raw_data = b''
+    for chunk in chunks:
+        raw_data += chunk
+        encoding = _detect_bytes(raw_data)
+        if encoding:
+            return encoding
+        if len(raw_data) >= ENCODING_DETECT_LIMIT:
+            break
+    return 'utf-8'
+
+
+def _cached_detect(file_path: Path, st: os.stat_result, chunks: Iterable[bytes]) -> str:
+    """Detect the encoding from chunks unless the same file version was seen before"""
+    key = (str(file_path), st.st_mtime_ns, st.st_size)
+    encoding = _encoding_cache.get(key)
+    if encoding is None:
+        if len(_encoding_cache) >= ENCODING_CACHE_SIZE:
+            _encoding_cache.clear()
+        encoding = _encoding_cache[key] = _detect_chunks(chunks)
+    return encoding
+
+
+def _open_sequential(file_path: Path) -> BinaryIO:
+    """
+    Open a file for one front-to-back read
+    Skips the atime update where permitted and asks for aggressive readahead
+    """
+    flags = os.O_RDONLY | getattr(os, 'O_BINARY', 0)
+    noatime = getattr(os, 'O_NOATIME', 0)
+    try:
+        fd = os.open(file_path, flags | noatime)
+    except PermissionError:
+        if not noatime:
+            raise
+        # O_NOATIME is only allowed for the file's owner
+        fd = os.open(file_path, flags)
+    
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+    
+    return os.fdopen(fd, 'rb')
 
 
 def detect_encoding(file_path: Path) -> str:
     """
-    Detect the encoding of a file using chardet
+    Detect the encoding of a file using the best available detector
     Returns the detected encoding or 'utf-8' as fallback
     """
     try:
-        with open(file_path, 'rb') as f:
-            raw_data = f.read()
-        
-        if not raw_data:
-            return 'utf-8'
-        
-        result = chardet.detect(raw_data)
-        encoding = result['encoding']
-        
-        if encoding and result['confidence'] > 0.7:
-            return encoding.lower()
-        else:
-            return 'utf-8'
+        with _open_sequential(file_path) as f:
+            st = os.fstat(f.fileno())
+            return _cached_detect(
+                file_path, st, iter(partial(f.read, ENCODING_DETECT_CHUNK), b'')
+            )
     except Exception:
         return 'utf-8'
 
 
-def load_file(file_path: Path, encoding: Optional[str] = None) -> Tuple[str, str]:
+def _decode(raw_data: Union[bytes, mmap.mmap], encoding: Optional[str]) -> Tuple[str, str]:
     """
-    Load a file with specified or detected encoding
+    Decode file bytes, falling back to utf-8 and then latin-1
     Returns tuple of (content, encoding_used)
     """
-    if not file_path.exists():
-        raise FileNotFoundError(f"File not found: {file_path}")
-    
-    # Use provided encoding or detect it
-    if encoding is None:
-        encoding = detect_encoding(file_path)
-    
+    # str() decodes straight from any buffer, including a mapped file
     try:
-        with open(file_path, 'r', encoding=encoding) as f:
-            content = f.read()
-        return content, encoding
+        return normalize_line_endings(str(raw_data, encoding)), encoding
     except UnicodeDecodeError:
         # Fallback to utf-8 if specified encoding fails
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            return content, 'utf-8'
+            return normalize_line_endings(str(raw_data, 'utf-8')), 'utf-8'
         except UnicodeDecodeError:
             # Last resort: latin-1 (can decode any byte sequence)
-            with open(file_path, 'r', encoding='latin-1') as f:
-                content = f.read()
-            return content, 'latin-1'
+            return normalize_line_endings(str(raw_data, 'latin-1')), 'latin-1'
+
+
+def load_file(file_path: Path, encoding: Optional[str] = None) -> Tuple[str, str]:
+    """
+    Load a file with specified or detected encoding
+    Returns tuple of (content, encoding_used)
+    """
+    # The file is read once; detection and decoding both work on these bytes.
+    # Large files are mapped instead, so the decoder reads the page cache
+    # directly rather than a full copy of the file.
+    try:
+        with _open_sequential(file_path) as f:
+            st = os.fstat(f.fileno())
+            if st.st_size >= MMAP_THRESHOLD:
+                raw_data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    raw_data.madvise(mmap.MADV_SEQUENTIAL)
+            else:
+                # read() with no size sizes its buffer from fstat and reads it in one go
+                raw_data = f.read()
+                
+                # The whole file is now in memory; its cached pages won't be reread
+                if hasattr(os, 'posix_fadvise'):
+                    try:
+                        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+                    except OSError:
+                        pass
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {file_path}") from None
+    
+    try:
+        # Use provided encoding or detect it
+        if encoding is None:
+            encoding = _cached_detect(file_path, st, (
+                raw_data[i:i + ENCODING_DETECT_CHUNK]
+                for i in range(0, len(raw_data), ENCODING_DETECT_CHUNK)
+            ))
+        
+        return _decode(raw_data, encoding)
+    finally:
+        if isinstance(raw_data, mmap.mmap):
+            raw_data.close()
+
+
+def _read_lines(f: BinaryIO, encoding: str) -> List[str]:
+    """
+    Decode a file chunk by chunk, splitting it at any line ending
+    Raises UnicodeDecodeError if the bytes are invalid in the encoding
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    lines: List[str] = []
+    partial_line: List[str] = []  # Pieces of the line still being read
+    carry_cr = False
+    
+    while True:
+        chunk = f.read(LOAD_CHUNK_SIZE)
+        text = decoder.decode(chunk, final=not chunk)
+        if carry_cr:
+            text = '\r' + text
+        
+        # A CR ending the chunk may be the first half of a CRLF
+        carry_cr = bool(chunk) and text.endswith('\r')
+        if carry_cr:
+            text = text[:-1]
+        
+        parts = normalize_line_endings(text).split('\n')
+        partial_line.append(parts[0])
+        if len(parts) > 1:
+            lines.append(''.join(partial_line))
+            lines.extend(parts[1:-1])
+            partial_line = [parts[-1]]
+        
+        if not chunk:
+            break
+    
+    # A trailing newline ends the last line rather than starting another
+    last = ''.join(partial_line)
+    if last or not lines:
+        lines.append(last)
+    return lines
+
+
+def load_lines(file_path: Path, encoding: Optional[str] = None) -> Tuple[List[str], str]:
+    """
+    Load a file as a list of lines with specified or detected encoding
+    Returns tuple of (lines, encoding_used)
+    """
+    # Decoding incrementally never holds the raw file, the decoded text and
+    # the lines at once; peak memory is about the size of the lines alone.
+    try:
+        with _open_sequential(file_path) as f:
+            if encoding is None:
+                st = os.fstat(f.fileno())
+                encoding = _cached_detect(
+                    file_path, st, iter(partial(f.read, ENCODING_DETECT_CHUNK), b'')
+                )
+            
+            # Fall back to utf-8 and then latin-1 (which decodes any bytes)
+            for candidate in (encoding, 'utf-8', 'latin-1'):
+                f.seek(0)
+                try:
+                    return _read_lines(f, candidate), candidate
+                except UnicodeDecodeError:
+                    continue
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {file_path}") from None
+
+
+def _join_lines(lines: Iterable[str], line_ending: str) -> Iterator[str]:
+    """Yield lines separated by line_ending, without a trailing terminator"""
+    it = iter(lines)
+    for line in it:
+        yield line
+        break
+    for line in it:
+        yield line_ending + line
 
 
-def save_file(file_path: Path, content: str, encoding: Optional[str] = None) -> None:
+@contextmanager
+def _atomic_writer(file_path: Path) -> Iterator[BinaryIO]:
+    """
+    Open a temporary sibling of file_path for writing and move it into place
+    on success, so an interrupted save never leaves a truncated file
+    """
+    # Write through symlinks rather than replacing the link itself
+    target = Path(os.path.realpath(file_path))
+    tmp_path = target.with_name(f"{target.name}.tmp.{os.getpid()}")
+    try:
+        with open(tmp_path, 'wb', buffering=IO_BUFFER_SIZE) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        
+        # Keep the permissions of the file being replaced
+        try:
+            shutil.copymode(target, tmp_path)
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_path, target)
+    except BaseException:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+
+def save_file(file_path: Path, content: Union[str, Iterable[str]],
+              encoding: Optional[str] = None) -> None:
     """
     Save content to a file with specified encoding
+    Content is a string, or an iterable of lines without terminators which
+    is streamed to disk instead of being joined in memory
     Uses config encoding if not specified
     """
     if encoding is None:
@@ -75,16 +359,24 @@ def save_file(file_path: Path, content: str, encoding: Optional[str] = None) ->
     # Convert line endings according to config
     line_ending = config.get_line_ending_chars()
     
-    # Normalize line endings first (convert all to \n)
-    content = content.replace('\r\n', '\n').replace('\r', '\n')
-    
-    # Apply desired line ending
-    if line_ending != '\n':
-        content = content.replace('\n', line_ending)
-    
     try:
-        with open(file_path, 'w', encoding=encoding, newline='') as f:
-            f.write(content)
+        if isinstance(content, str):
+            # Normalize line endings first (convert all to \n)
+            content = normalize_line_endings(content)
+            
+            # Apply desired line ending
+            if line_ending != '\n' and '\n' in content:
+                content = content.replace('\n', line_ending)
+            
+            data = content.encode(encoding)
+            with _atomic_writer(file_path) as f:
+                f.write(data)
+        else:
+            # An incremental encoder writes a BOM (utf-16, utf-8-sig) only once
+            encode = codecs.getincrementalencoder(encoding)().encode
+            with _atomic_writer(file_path) as f:
+                f.writelines(encode(chunk) for chunk in _join_lines(content, line_ending))
+                f.write(encode('', True))
     except UnicodeEncodeError as e:
         raise ValueError(f"Cannot encode file with {encoding}: {e}")
 
@@ -93,7 +385,10 @@ def get_file_info(file_path: Path) -> dict:
     """
     Get information about a file (size, modification time, etc.)
     """
-    if not file_path.exists():
+    # One stat answers both "does it exist" and everything reported below
+    try:
+        st = file_path.stat()
+    except FileNotFoundError:
         return {
             'exists': False,
             'size': 0,
@@ -102,17 +397,57 @@ def get_file_info(file_path: Path) -> dict:
             'writable': False
         }
     
-    stat = file_path.stat()
+    is_file = S_ISREG(st.st_mode)
     
     return {
         'exists': True,
-        'size': stat.st_size,
-        'modified': stat.st_mtime,
-        'readable': file_path.is_file() and file_path.stat().st_mode & 0o444,
-        'writable': file_path.is_file() and file_path.stat().st_mode & 0o200
+        'size': st.st_size,
+        'modified': st.st_mtime,
+        'readable': is_file and st.st_mode & 0o444,
+        'writable': is_file and st.st_mode & 0o200
     }
 
 
+# ioctl request that makes a file share another's blocks (Linux btrfs/xfs)
+_FICLONE = 0x40049409
+
+
+def _copy_file_fast(src: Path, dst: Path) -> None:
+    """
+    Copy file contents without passing them through user space when possible
+    Tries a reflink clone, then os.copy_file_range, then a buffered copy
+    """
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+        
+        if sys.platform.startswith('linux'):
+            try:
+                import fcntl
+                fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+                return
+            except OSError:
+                pass
+        
+        if hasattr(os, 'copy_file_range'):
+            try:
+                remaining = os.fstat(src_fd).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(src_fd, dst_fd, remaining)
+                    if not copied:
+                        break
+                    remaining -= copied
+                else:
+                    return
+            except OSError:
+                pass
+            # Start over with a plain copy (e.g. across filesystems)
+            fsrc.seek(0)
+            fdst.seek(0)
+            fdst.truncate()
+        
+        shutil.copyfileobj(fsrc, fdst, IO_BUFFER_SIZE)
+
+
 def backup_file(file_path: Path) -> Path:
     """
     Create a backup of the file before saving
@@ -121,7 +456,7 @@ def backup_file(file_path: Path) -> Path:
     backup_path = file_path.with_suffix(file_path.suffix + '.bak')
     
     if file_path.exists():
-        import shutil
-        shutil.copy2(file_path, backup_path)
+        _copy_file_fast(file_path, backup_path)
+        shutil.copystat(file_path, backup_path)
     
     return backup_path
@@ -5,8 +5,6 @@ RetroEdit main module - Entry point for the package
 
 import sys
 import argparse
-from pathlib import Path
-from .app import RetroEditApp
 
 
 def main():
@@ -33,11 +31,15 @@ def main():
     
     args = parser.parse_args()
     
+    # Imported late so --help and argument errors don't pay for loading Textual
+    from .app import RetroEditApp
+    
     # Initialize the application
     app = RetroEditApp()
     
     # Open file if specified
     if args.file:
+        from pathlib import Path
         file_path = Path(args.file)
         if file_path.exists():
             app.open_file(file_path, encoding=args.encoding)
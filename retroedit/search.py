@@ -0,0 +1,105 @@
+"""
+Text search for RetroEdit
+Boyer-Moore-Horspool searcher with a rare-character anchor
+"""
+
+from typing import Optional, Tuple
+
+
+# Letters ranked by how common they are in English text (higher = more common).
+# Anything not listed counts as rare, which makes it a good anchor.
+_LETTER_ORDER = "zqxjkvbpygfwmucldrhsnioate "
+_FREQUENCY_RANK = {char: rank for rank, char in enumerate(_LETTER_ORDER, start=1)}
+
+# Bad-character shift tables are indexed by the low byte of the code point
+_TABLE_SIZE = 256
+
+
+class BMHSearcher:
+    """Searcher for a fixed pattern with its skip table precomputed once"""
+    
+    def __init__(self, pattern: str, case_sensitive: bool = True):
+        self.pattern = pattern
+        self.case_sensitive = case_sensitive
+        self._needle = pattern if case_sensitive else pattern.lower()
+        
+        needle = self._needle
+        m = len(needle)
+        
+        # Distance from the last occurrence of each character (excluding the
+        # final position) to the end of the pattern. When ignoring case, ASCII
+        # upper case letters share their lower case entry so the scan can
+        # index the table with text characters as they are.
+        self._shift = [m] * _TABLE_SIZE
+        for i, char in enumerate(needle[:-1]):
+            self._shift[ord(char) & 0xff] = m - 1 - i
+            if not case_sensitive and char.isascii():
+                self._shift[ord(char.upper()) & 0xff] = m - 1 - i
+        
+        # The statistically rarest character rejects most windows with one read
+        self._anchor = min(
+            range(m), key=lambda i: _FREQUENCY_RANK.get(needle[i].lower(), 0)
+        ) if m else 0
+    
+    def find(self, text: str, start: int = 0, end: Optional[int] = None) -> int:
+        """Return the index of the first match in text[start:end], or -1"""
+        if self.case_sensitive:
+            # CPython's str.find is itself a Horspool variant running in C
+            return text.find(self._needle, start, end)
+        return self._scan(text, start, end)
+    
+    def replace_in_line(self, line: str, replacement: str) -> Tuple[str, int]:
+        """Replace all non-overlapping matches, returning (new_line, count)"""
+        if not self._needle:
+            # An empty pattern matches everywhere without advancing
+            return line, 0
+        
+        if self.case_sensitive:
+            # One C-level scan yields both the pieces and the match count
+            parts = line.split(self._needle)
+            return replacement.join(parts), len(parts) - 1
+        
+        pos = self.find(line)
+        if pos < 0:
+            return line, 0
+        
+        m = len(self._needle)
+        parts = []
+        prev = 0
+        count = 0
+        while pos >= 0:
+            parts.append(line[prev:pos])
+            parts.append(replacement)
+            prev = pos + m
+            count += 1
+            pos = self.find(line, prev)
+        parts.append(line[prev:])
+        
+        return ''.join(parts), count
+    
+    def _scan(self, text: str, start: int, end: Optional[int]) -> int:
+        """Horspool scan comparing case-folded characters"""
+        needle = self._needle
+        m = len(needle)
+        n = len(text) if end is None else min(end, len(text))
+        if m == 0:
+            return start if start <= n else -1
+        
+        shift = self._shift
+        anchor = self._anchor
+        anchor_char = needle[anchor]
+        last = m - 1
+        
+        i = max(start, 0) + last
+        while i < n:
+            window = i - last
+            if (text[window + anchor].lower() == anchor_char
+                    and text[window:i + 1].lower() == needle):
+                return window
+            char = text[i]
+            if char >= '\x80':
+                # Non-ASCII characters may fold to another character entirely
+                char = char.lower()[0]
+            i += shift[ord(char) & 0xff]
+        
+        return -1
@@ -1,3 +1,17 @@
 """
 UI components for RetroEdit
 """
+
+# Dialogs are only needed once one is opened, so their module is imported
+# on first access to any of these names (PEP 562)
+_DIALOGS = frozenset({
+    "DialogResult", "SaveAsDialog", "FindReplaceDialog", "GoToLineDialog", "OpenFileDialog",
+})
+
+
+def __getattr__(name):
+    """Import dialog classes on first access"""
+    if name in _DIALOGS:
+        from . import dialogs
+        return getattr(dialogs, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
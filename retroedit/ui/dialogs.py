@@ -45,15 +45,24 @@ class SaveAsDialog(ModalScreen):
                 yield Button("Save", variant="primary", id="save-button")
                 yield Button("Cancel", variant="default", id="cancel-button")
     
+    def on_mount(self) -> None:
+        """Cache the input widget used by the actions"""
+        self._file_input = self.query_one("#file-input", Input)
+    
+    # Button id -> action method name
+    _HANDLERS = {
+        "save-button": "action_save",
+        "cancel-button": "action_cancel",
+    }
+    
     def on_button_pressed(self, event: Button.Pressed) -> None:
-        if event.button.id == "save-button":
-            self.action_save()
-        elif event.button.id == "cancel-button":
-            self.action_cancel()
+        method = self._HANDLERS.get(event.button.id)
+        if method:
+            getattr(self, method)()
     
     def action_save(self) -> None:
         """Save with entered filename"""
-        input_widget = self.query_one("#file-input", Input)
+        input_widget = self._file_input
         file_path = input_widget.value.strip()
         
         if file_path:
@@ -102,22 +111,29 @@ class FindReplaceDialog(ModalScreen):
     
     def on_mount(self) -> None:
         """Focus find input when dialog opens"""
-        self.query_one("#find-input", Input).focus()
+        # Cached so repeated find/replace actions skip the DOM queries
+        self._find_input = self.query_one("#find-input", Input)
+        self._replace_input = self.query_one("#replace-input", Input)
+        self._case_checkbox = self.query_one("#case-checkbox", Checkbox)
+        self._find_input.focus()
+    
+    # Button id -> action method name
+    _HANDLERS = {
+        "find-button": "action_find_next",
+        "replace-button": "action_replace",
+        "replace-all-button": "action_replace_all",
+        "close-button": "action_cancel",
+    }
     
     def on_button_pressed(self, event: Button.Pressed) -> None:
-        if event.button.id == "find-button":
-            self.action_find_next()
-        elif event.button.id == "replace-button":
-            self.action_replace()
-        elif event.button.id == "replace-all-button":
-            self.action_replace_all()
-        elif event.button.id == "close-button":
-            self.action_cancel()
+        method = self._HANDLERS.get(event.button.id)
+        if method:
+            getattr(self, method)()
     
     def action_find_next(self) -> None:
         """Find next occurrence"""
-        find_input = self.query_one("#find-input", Input)
-        case_checkbox = self.query_one("#case-checkbox", Checkbox)
+        find_input = self._find_input
+        case_checkbox = self._case_checkbox
         
         find_text = find_input.value.strip()
         if find_text:
@@ -130,9 +146,9 @@ class FindReplaceDialog(ModalScreen):
     
     def action_replace(self) -> None:
         """Replace current occurrence"""
-        find_input = self.query_one("#find-input", Input)
-        replace_input = self.query_one("#replace-input", Input)
-        case_checkbox = self.query_one("#case-checkbox", Checkbox)
+        find_input = self._find_input
+        replace_input = self._replace_input
+        case_checkbox = self._case_checkbox
         
         find_text = find_input.value.strip()
         replace_text = replace_input.value
@@ -149,9 +165,9 @@ class FindReplaceDialog(ModalScreen):
     
     def action_replace_all(self) -> None:
         """Replace all occurrences"""
-        find_input = self.query_one("#find-input", Input)
-        replace_input = self.query_one("#replace-input", Input)
-        case_checkbox = self.query_one("#case-checkbox", Checkbox)
+        find_input = self._find_input
+        replace_input = self._replace_input
+        case_checkbox = self._case_checkbox
         
         find_text = find_input.value.strip()
         replace_text = replace_input.value
@@ -198,17 +214,23 @@ class GoToLineDialog(ModalScreen):
     
     def on_mount(self) -> None:
         """Focus line input when dialog opens"""
-        self.query_one("#line-input", Input).focus()
+        self._line_input = self.query_one("#line-input", Input)
+        self._line_input.focus()
+    
+    # Button id -> action method name
+    _HANDLERS = {
+        "go-button": "action_go_to_line",
+        "cancel-button": "action_cancel",
+    }
     
     def on_button_pressed(self, event: Button.Pressed) -> None:
-        if event.button.id == "go-button":
-            self.action_go_to_line()
-        elif event.button.id == "cancel-button":
-            self.action_cancel()
+        method = self._HANDLERS.get(event.button.id)
+        if method:
+            getattr(self, method)()
     
     def action_go_to_line(self) -> None:
         """Go to specified line"""
-        input_widget = self.query_one("#line-input", Input)
+        input_widget = self._line_input
         
         try:
             line_num = int(input_widget.value)
@@ -254,17 +276,23 @@ class OpenFileDialog(ModalScreen):
     
     def on_mount(self) -> None:
         """Focus file input when dialog opens"""
-        self.query_one("#file-input", Input).focus()
+        self._file_input = self.query_one("#file-input", Input)
+        self._file_input.focus()
+    
+    # Button id -> action method name
+    _HANDLERS = {
+        "open-button": "action_open",
+        "cancel-button": "action_cancel",
+    }
     
     def on_button_pressed(self, event: Button.Pressed) -> None:
-        if event.button.id == "open-button":
-            self.action_open()
-        elif event.button.id == "cancel-button":
-            self.action_cancel()
+        method = self._HANDLERS.get(event.button.id)
+        if method:
+            getattr(self, method)()
     
     def action_open(self) -> None:
         """Open specified file"""
-        input_widget = self.query_one("#file-input", Input)
+        input_widget = self._file_input
         file_path = input_widget.value.strip()
         
         if file_path:
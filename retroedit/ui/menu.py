@@ -9,7 +9,60 @@ from textual.widgets import Button, Label
 from textual.containers import Horizontal
 from textual.message import Message
 from textual.binding import Binding
-from typing import Dict, List, Callable, Optional
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
+
+
+# Menu name -> items, built once at import and shared by every MenuBar
+_MENU_ITEMS: Mapping[str, Tuple[Dict, ...]] = MappingProxyType({
+    "file": (
+        {"label": "New", "action": "file_new", "key": "Ctrl+N"},
+        {"label": "Open...", "action": "file_open", "key": "Ctrl+O"},
+        {"separator": True},
+        {"label": "Save", "action": "file_save", "key": "Ctrl+S"},
+        {"label": "Save As...", "action": "file_save_as", "key": "F2"},
+        {"separator": True},
+        {"label": "Exit", "action": "file_exit", "key": "Ctrl+Q"},
+    ),
+    "edit": (
+        {"label": "Undo", "action": "edit_undo", "key": "Ctrl+Z"},
+        {"label": "Redo", "action": "edit_redo", "key": "Ctrl+Y"},
+        {"separator": True},
+        {"label": "Cut", "action": "edit_cut", "key": "Ctrl+X"},
+        {"label": "Copy", "action": "edit_copy", "key": "Ctrl+C"},
+        {"label": "Paste", "action": "edit_paste", "key": "Ctrl+V"},
+        {"separator": True},
+        {"label": "Find", "action": "edit_find", "key": "Ctrl+F"},
+        {"label": "Replace", "action": "edit_replace", "key": "Ctrl+R"},
+        {"label": "Go to Line", "action": "edit_goto", "key": "Ctrl+G"},
+    ),
+    "view": (
+        {"label": "Status Bar", "action": "view_status_bar", "checkable": True},
+        {"label": "Line Numbers", "action": "view_line_numbers", "checkable": True},
+        {"separator": True},
+        {"label": "Theme", "action": "view_theme", "submenu": (
+            {"label": "Black", "action": "view_theme_black"},
+            {"label": "Blue", "action": "view_theme_blue"},
+        )},
+        {"separator": True},
+        {"label": "Line Endings", "action": "view_line_endings", "submenu": (
+            {"label": "CR", "action": "view_line_ending_cr"},
+            {"label": "LF", "action": "view_line_ending_lf"}, 
+            {"label": "CRLF", "action": "view_line_ending_crlf"},
+        )},
+        {"label": "Encoding", "action": "view_encoding", "submenu": (
+            {"label": "UTF-8", "action": "view_encoding_utf8"},
+            {"label": "CP437", "action": "view_encoding_cp437"},
+            {"label": "CP1252", "action": "view_encoding_cp1252"},
+            {"label": "Latin-1", "action": "view_encoding_latin1"},
+        )},
+    ),
+    "help": (
+        {"label": "Keyboard Shortcuts", "action": "help_shortcuts"},
+        {"separator": True},
+        {"label": "About RetroEdit", "action": "help_about"},
+    ),
+})
 
 
 class MenuAction(Message):
@@ -34,7 +87,7 @@ class MenuBar(Widget):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.active_menu: Optional[str] = None
-        self.menu_items = self._build_menu_structure()
+        self.menu_items = _MENU_ITEMS
     
     def compose(self) -> ComposeResult:
         """Create the menu bar layout"""
@@ -45,70 +98,19 @@ class MenuBar(Widget):
             yield Button("Help", id="help-menu", variant="primary")
             yield Label("", id="menu-spacer")
     
-    def _build_menu_structure(self) -> Dict[str, List[Dict]]:
-        """Build the menu structure"""
-        return {
-            "file": [
-                {"label": "New", "action": "file_new", "key": "Ctrl+N"},
-                {"label": "Open...", "action": "file_open", "key": "Ctrl+O"},
-                {"separator": True},
-                {"label": "Save", "action": "file_save", "key": "Ctrl+S"},
-                {"label": "Save As...", "action": "file_save_as", "key": "F2"},
-                {"separator": True},
-                {"label": "Exit", "action": "file_exit", "key": "Ctrl+Q"},
-            ],
-            "edit": [
-                {"label": "Undo", "action": "edit_undo", "key": "Ctrl+Z"},
-                {"label": "Redo", "action": "edit_redo", "key": "Ctrl+Y"},
-                {"separator": True},
-                {"label": "Cut", "action": "edit_cut", "key": "Ctrl+X"},
-                {"label": "Copy", "action": "edit_copy", "key": "Ctrl+C"},
-                {"label": "Paste", "action": "edit_paste", "key": "Ctrl+V"},
-                {"separator": True},
-                {"label": "Find", "action": "edit_find", "key": "Ctrl+F"},
-                {"label": "Replace", "action": "edit_replace", "key": "Ctrl+R"},
-                {"label": "Go to Line", "action": "edit_goto", "key": "Ctrl+G"},
-            ],
-            "view": [
-                {"label": "Status Bar", "action": "view_status_bar", "checkable": True},
-                {"label": "Line Numbers", "action": "view_line_numbers", "checkable": True},
-                {"separator": True},
-                {"label": "Theme", "action": "view_theme", "submenu": [
-                    {"label": "Black", "action": "view_theme_black"},
-                    {"label": "Blue", "action": "view_theme_blue"},
-                ]},
-                {"separator": True},
-                {"label": "Line Endings", "action": "view_line_endings", "submenu": [
-                    {"label": "CR", "action": "view_line_ending_cr"},
-                    {"label": "LF", "action": "view_line_ending_lf"}, 
-                    {"label": "CRLF", "action": "view_line_ending_crlf"},
-                ]},
-                {"label": "Encoding", "action": "view_encoding", "submenu": [
-                    {"label": "UTF-8", "action": "view_encoding_utf8"},
-                    {"label": "CP437", "action": "view_encoding_cp437"},
-                    {"label": "CP1252", "action": "view_encoding_cp1252"},
-                    {"label": "Latin-1", "action": "view_encoding_latin1"},
-                ]},
-            ],
-            "help": [
-                {"label": "Keyboard Shortcuts", "action": "help_shortcuts"},
-                {"separator": True},
-                {"label": "About RetroEdit", "action": "help_about"},
-            ],
-        }
+    # Button id -> action method name
+    _HANDLERS = {
+        "file-menu": "action_show_file_menu",
+        "edit-menu": "action_show_edit_menu",
+        "view-menu": "action_show_view_menu",
+        "help-menu": "action_show_help_menu",
+    }
     
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle menu button press"""
-        button_id = event.button.id
-        
-        if button_id == "file-menu":
-            self.action_show_file_menu()
-        elif button_id == "edit-menu":
-            self.action_show_edit_menu()
-        elif button_id == "view-menu":
-            self.action_show_view_menu()
-        elif button_id == "help-menu":
-            self.action_show_help_menu()
+        method = self._HANDLERS.get(event.button.id)
+        if method:
+            getattr(self, method)()
     
     def action_toggle_menu(self) -> None:
         """Toggle menu bar activation"""
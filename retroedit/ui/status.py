@@ -8,13 +8,20 @@ from textual.widget import Widget
 from textual.widgets import Label
 from textual.containers import Horizontal
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 from ..config import config
 
 
+# Status bar segments, each rendered by its own label so that a change to
+# one (typically the cursor position) repaints only that label
+STATUS_FIELDS = ("mode", "encoding", "line-ending", "filename", "cursor", "modified")
+
+
 class StatusBar(Widget):
     """Status bar widget showing editor information"""
     
+    _CURSOR_FMT = "Ln {}, Col {}".format
+    
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.file_path: Optional[Path] = None
@@ -22,11 +29,18 @@ class StatusBar(Widget):
         self.cursor_col: int = 0
         self.modified: bool = False
         self.encoding: str = "UTF-8"
+        # Segment texts currently shown, and their labels once looked up
+        self._last_status: Tuple[str, ...] = ()
+        self._labels: Dict[str, Label] = {}
+        # Cursor text is only reformatted when the position moves
+        self._cursor_key: Tuple[int, int] = (-1, -1)
+        self._cursor_info: str = ""
         
     def compose(self) -> ComposeResult:
         """Create the status bar layout"""
-        with Horizontal():
-            yield Label("", id="status-info")
+        with Horizontal(id="status-info"):
+            for field in STATUS_FIELDS:
+                yield Label("", id=f"status-{field}", classes="status-field")
     
     def update_status(
         self, 
@@ -60,20 +74,38 @@ class StatusBar(Widget):
             filename = "Untitled"
         
         # Cursor position (1-based for display)
-        cursor_info = f"Ln {self.cursor_row + 1}, Col {self.cursor_col + 1}"
+        cursor_key = (self.cursor_row, self.cursor_col)
+        if cursor_key != self._cursor_key:
+            self._cursor_key = cursor_key
+            self._cursor_info = self._CURSOR_FMT(self.cursor_row + 1, self.cursor_col + 1)
+        cursor_info = self._cursor_info
         
         # Modified indicator
         modified_indicator = " *" if self.modified else ""
         
-        # Build status text
-        status_text = (
-            f" {mode} | {self.encoding} | {line_ending} | {filename} | "
-            f"{cursor_info}{modified_indicator}"
+        # Build status segments; together they read
+        # " mode | encoding | line ending | filename | cursor *"
+        segments = (
+            f" {mode} | ",
+            f"{self.encoding} | ",
+            f"{line_ending} | ",
+            f"{filename} | ",
+            cursor_info,
+            modified_indicator,
         )
+        if segments == self._last_status:
+            return
         
-        # Update the label
-        status_label = self.query_one("#status-info", Label)
-        status_label.update(status_text)
+        # Update only the labels whose text changed
+        if not self._labels:
+            self._labels = {
+                field: self.query_one(f"#status-{field}", Label) for field in STATUS_FIELDS
+            }
+        previous = self._last_status or ("",) * len(STATUS_FIELDS)
+        for field, text, old_text in zip(STATUS_FIELDS, segments, previous):
+            if text != old_text:
+                self._labels[field].update(text)
+        self._last_status = segments
     
     def on_mount(self) -> None:
         """Called when widget is mounted"""
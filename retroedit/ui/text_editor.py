@@ -9,14 +9,61 @@ from textual.widgets import TextArea
 from textual.containers import Horizontal, Vertical
 from textual.binding import Binding
 from textual.message import Message
+from textual.timer import Timer
 from rich.text import Text
 from rich.syntax import Syntax
+from types import ModuleType
 from typing import Optional
 from pathlib import Path
 from ..editor import TextBuffer
 from ..config import config
 
 
+# Minimum seconds between EditorUpdate messages (~60 Hz)
+UPDATE_THROTTLE_INTERVAL = 0.016
+
+# Lines compared per slice when looking for the edited range of the buffer
+DIFF_BLOCK_LINES = 1024
+
+
+# Built once at import; every TextEditor shares the same immutable bindings
+_BINDINGS = (
+    # File operations
+    Binding("ctrl+o", "open_file", "Open"),
+    Binding("ctrl+s", "save_file", "Save"),
+    Binding("f2", "save_as_file", "Save As"),
+    Binding("ctrl+n", "new_file", "New"),
+    Binding("ctrl+q", "quit", "Quit"),
+    
+    # Edit operations
+    Binding("ctrl+z", "undo", "Undo"),
+    Binding("ctrl+y", "redo", "Redo"),
+    Binding("ctrl+x", "cut", "Cut"),
+    Binding("ctrl+c", "copy", "Copy"),
+    Binding("ctrl+v", "paste", "Paste"),
+    
+    # Find/Replace
+    Binding("ctrl+f", "find", "Find"),
+    Binding("ctrl+r", "replace", "Replace"),
+    Binding("ctrl+g", "goto_line", "Go to Line"),
+    
+    # Mode toggle
+    Binding("insert", "toggle_insert_mode", "Insert/Replace"),
+)
+
+# Dialogs module, imported when the editor first opens a dialog
+_dialogs: Optional[ModuleType] = None
+
+
+def _get_dialogs() -> ModuleType:
+    """Return the dialogs module, importing it on first use"""
+    global _dialogs
+    if _dialogs is None:
+        from . import dialogs
+        _dialogs = dialogs
+    return _dialogs
+
+
 class EditorUpdate(Message):
     """Message sent when editor content changes"""
     
@@ -27,29 +74,7 @@ class EditorUpdate(Message):
 class TextEditor(Widget):
     """Text editor widget with line numbers and scrolling"""
     
-    BINDINGS = [
-        # File operations
-        Binding("ctrl+o", "open_file", "Open"),
-        Binding("ctrl+s", "save_file", "Save"),
-        Binding("f2", "save_as_file", "Save As"),
-        Binding("ctrl+n", "new_file", "New"),
-        Binding("ctrl+q", "quit", "Quit"),
-        
-        # Edit operations
-        Binding("ctrl+z", "undo", "Undo"),
-        Binding("ctrl+y", "redo", "Redo"),
-        Binding("ctrl+x", "cut", "Cut"),
-        Binding("ctrl+c", "copy", "Copy"),
-        Binding("ctrl+v", "paste", "Paste"),
-        
-        # Find/Replace
-        Binding("ctrl+f", "find", "Find"),
-        Binding("ctrl+r", "replace", "Replace"),
-        Binding("ctrl+g", "goto_line", "Go to Line"),
-        
-        # Mode toggle
-        Binding("insert", "toggle_insert_mode", "Insert/Replace"),
-    ]
+    BINDINGS = _BINDINGS
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -57,6 +82,11 @@ class TextEditor(Widget):
         self.scroll_offset_row = 0
         self.scroll_offset_col = 0
         self.clipboard_text = ""
+        # Throttle state for EditorUpdate: a timer runs while updates are
+        # being held back, and the flag says one arrived in that window
+        self._update_timer: Optional[Timer] = None
+        self._update_pending = False
+        self._text_area: Optional[TextArea] = None
         
     def compose(self) -> ComposeResult:
         """Create the text editor layout"""
@@ -68,11 +98,16 @@ class TextEditor(Widget):
         """Called when widget is mounted"""
         self._update_text_area()
         
+    def _get_text_area(self) -> TextArea:
+        """Get the text area widget, looking it up only once"""
+        if self._text_area is None:
+            self._text_area = self.query_one("#text-area", TextArea)
+        return self._text_area
+    
     def _update_text_area(self) -> None:
         """Update the text area with current buffer content"""
-        text_area = self.query_one("#text-area", TextArea)
-        content = '\n'.join(self.buffer.lines)
-        text_area.text = content
+        text_area = self._get_text_area()
+        self._push_changed_lines(text_area)
         
         # Set cursor position
         cursor_row, cursor_col = self.buffer.get_cursor_position()
@@ -82,15 +117,83 @@ class TextEditor(Widget):
             pass  # Ignore cursor positioning errors
         
         # Post update message
+        self._post_update()
+    
+    def _push_changed_lines(self, text_area: TextArea) -> None:
+        """Replace only the lines that differ between the buffer and the text area"""
+        old = text_area.document.lines
+        new = self.buffer.lines
+        if old == new:
+            return
+        
+        # Trim the unchanged lines at both ends; the edit is what remains.
+        # Whole blocks are compared as list slices in C first, so only the
+        # block holding the edit is walked line by line.
+        block = DIFF_BLOCK_LINES
+        limit = min(len(old), len(new))
+        prefix = 0
+        while prefix + block <= limit and old[prefix:prefix + block] == new[prefix:prefix + block]:
+            prefix += block
+        while prefix < limit and old[prefix] == new[prefix]:
+            prefix += 1
+        
+        room = limit - prefix
+        old_end = len(old)
+        new_end = len(new)
+        while block <= room and old[old_end - block:old_end] == new[new_end - block:new_end]:
+            old_end -= block
+            new_end -= block
+            room -= block
+        while room and old[old_end - 1] == new[new_end - 1]:
+            old_end -= 1
+            new_end -= 1
+            room -= 1
+        suffix = len(old) - old_end
+        
+        changed = new[prefix:len(new) - suffix]
+        if suffix:
+            # Lines follow the edit, so each replacement line ends with a newline
+            text_area.replace(
+                "".join(line + "\n" for line in changed),
+                (prefix, 0),
+                (len(old) - suffix, 0),
+            )
+        elif prefix:
+            # The edit runs to the end, so each line starts with a newline
+            text_area.replace(
+                "".join("\n" + line for line in changed),
+                (prefix - 1, len(old[prefix - 1])),
+                (len(old) - 1, len(old[-1])),
+            )
+        else:
+            text_area.text = '\n'.join(new)
+    
+    def _post_update(self) -> None:
+        """Post EditorUpdate at most once per throttle interval"""
+        if self._update_timer is not None:
+            # A burst is in progress; the timer sends one trailing update
+            self._update_pending = True
+            return
+        
         self.post_message(EditorUpdate())
+        self._update_timer = self.set_timer(UPDATE_THROTTLE_INTERVAL, self._end_update_throttle)
+    
+    def _end_update_throttle(self) -> None:
+        """Send the update held back during the last interval, if any"""
+        self._update_timer = None
+        if self._update_pending:
+            self._update_pending = False
+            self._post_update()
     
     def _sync_from_text_area(self) -> None:
         """Sync buffer from text area content"""
-        text_area = self.query_one("#text-area", TextArea)
-        content = text_area.text
+        text_area = self._get_text_area()
         
-        # Update buffer lines
-        self.buffer.lines = content.splitlines() or [""]
+        # Copy the document's line list rather than joining it into text and
+        # splitting it again; the copy keeps the buffer from aliasing the
+        # document's list. Assigning buffer.lines resets the search filter
+        # and records the replacement as one undoable edit.
+        self.buffer.lines = list(text_area.document.lines)
         
         # Update cursor position
         if hasattr(text_area, 'cursor_location'):
@@ -176,7 +279,7 @@ class TextEditor(Widget):
     
     def action_cut(self) -> None:
         """Cut action"""
-        text_area = self.query_one("#text-area", TextArea)
+        text_area = self._get_text_area()
         if text_area.selected_text:
             self.clipboard_text = text_area.selected_text
             text_area.delete_selection()
@@ -185,33 +288,30 @@ class TextEditor(Widget):
     
     def action_copy(self) -> None:
         """Copy action"""
-        text_area = self.query_one("#text-area", TextArea)
+        text_area = self._get_text_area()
         if text_area.selected_text:
             self.clipboard_text = text_area.selected_text
     
     def action_paste(self) -> None:
         """Paste action"""
         if self.clipboard_text:
-            text_area = self.query_one("#text-area", TextArea)
+            text_area = self._get_text_area()
             text_area.insert(self.clipboard_text)
             self._sync_from_text_area()
             self._update_text_area()
     
     def action_find(self) -> None:
         """Find action"""
-        from .dialogs import FindReplaceDialog
-        self.app.push_screen(FindReplaceDialog())
+        self.app.push_screen(_get_dialogs().FindReplaceDialog())
     
     def action_replace(self) -> None:
         """Replace action"""
-        from .dialogs import FindReplaceDialog
-        self.app.push_screen(FindReplaceDialog())
+        self.app.push_screen(_get_dialogs().FindReplaceDialog())
     
     def action_goto_line(self) -> None:
         """Go to line action"""
-        from .dialogs import GoToLineDialog
         max_lines = self.buffer.get_line_count()
-        self.app.push_screen(GoToLineDialog(max_lines))
+        self.app.push_screen(_get_dialogs().GoToLineDialog(max_lines))
     
     def action_toggle_insert_mode(self) -> None:
         """Toggle insert/replace mode"""
@@ -4,9 +4,23 @@ Helper functions for text operations, formatting, etc.
 """
 
 import re
+from array import array
+from bisect import bisect_left
 from typing import List, Tuple, Optional
 
 
+# \w matches exactly the characters is_word_char accepts, and lets the
+# regex engine classify them in C
+_WORD_RE = re.compile(r'\w*')
+
+# CRLF or lone CR; used when CRs make up less than 1/_SPARSE_CR_RATIO of the text
+_NORM_RE = re.compile(r'\r\n?')
+_SPARSE_CR_RATIO = 64
+
+# Units for format_file_size, each 1024 times the previous
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
 def wrap_text(text: str, width: int) -> List[str]:
     """
     Wrap text to specified width, breaking at word boundaries when possible
@@ -14,34 +28,43 @@ def wrap_text(text: str, width: int) -> List[str]:
     if not text:
         return [""]
     
+    source = text.splitlines()
+    # Text that already fits is returned as split, without a per-line loop
+    if max(map(len, source)) <= width:
+        return source
+    
+    # Bound methods save an attribute lookup per output line
     lines = []
-    for line in text.splitlines():
+    append = lines.append
+    extend = lines.extend
+    for line in source:
         if len(line) <= width:
-            lines.append(line)
+            append(line)
         else:
-            # Break long lines at word boundaries
-            words = line.split()
-            current_line = ""
+            # Break long lines at word boundaries, collecting the words of
+            # the current output line and joining them once it is full
+            current_words = []
+            current_len = 0
             
-            for word in words:
-                if len(current_line + " " + word) <= width:
-                    if current_line:
-                        current_line += " " + word
-                    else:
-                        current_line = word
-                else:
-                    if current_line:
-                        lines.append(current_line)
-                        current_line = word
-                    else:
-                        # Word is longer than width, break it
-                        while len(word) > width:
-                            lines.append(word[:width])
-                            word = word[width:]
-                        current_line = word
+            for word in line.split():
+                need = current_len + len(word) + (1 if current_words else 0)
+                if need <= width:
+                    current_words.append(word)
+                    current_len = need
+                    continue
+                
+                if current_words:
+                    append(" ".join(current_words))
+                
+                if len(word) > width:
+                    # Word is longer than width, break it
+                    extend(word[i:i + width] for i in range(0, len(word) - width, width))
+                    word = word[-(len(word) % width or width):]
+                current_words = [word]
+                current_len = len(word)
             
-            if current_line:
-                lines.append(current_line)
+            if current_words:
+                append(" ".join(current_words))
     
     return lines
 
@@ -50,6 +73,10 @@ def expand_tabs(text: str, tab_size: int = 4) -> str:
     """
     Expand tabs to spaces
     """
+    # expandtabs walks every character computing columns even when there is
+    # no tab; the memchr-backed membership test is far cheaper
+    if '\t' not in text:
+        return text
     return text.expandtabs(tab_size)
 
 
@@ -57,36 +84,31 @@ def count_leading_whitespace(line: str) -> int:
     """
     Count leading whitespace characters in a line
     """
-    count = 0
-    for char in line:
-        if char in ' \t':
-            count += 1
-        else:
-            break
-    return count
+    return len(line) - len(line.lstrip(' \t'))
 
 
 def get_indentation(line: str, tab_size: int = 4) -> str:
     """
     Get the indentation string from a line
     """
-    indent = ""
-    for char in line:
-        if char == ' ':
-            indent += ' '
-        elif char == '\t':
-            indent += ' ' * tab_size
-        else:
-            break
-    return indent
+    indent = line[:count_leading_whitespace(line)]
+    return indent.replace('\t', ' ' * tab_size)
 
 
 def normalize_line_endings(text: str, ending: str = "\n") -> str:
     """
     Normalize line endings in text
     """
-    # First, normalize all line endings to \n
-    text = text.replace('\r\n', '\n').replace('\r', '\n')
+    # Each pass is skipped when there is nothing for it to change. A single
+    # re.sub pass wins when CRs are sparse (a few stray endings); its
+    # per-match cost loses to str.replace when every line ends in CR or CRLF.
+    cr_count = text.count('\r')
+    if cr_count * _SPARSE_CR_RATIO >= len(text):
+        text = text.replace('\r\n', '\n')
+        if '\r' in text:
+            text = text.replace('\r', '\n')
+    elif cr_count:
+        text = _NORM_RE.sub('\n', text)
     
     # Then apply the desired ending
     if ending != '\n':
@@ -111,28 +133,34 @@ def find_matching_bracket(text: str, pos: int) -> Optional[int]:
     pairs = {"(": ")", "[": "]", "{": "}"}
     reverse_pairs = {v: k for k, v in pairs.items()}
     
+    # Jump between occurrences of the partner bracket with C-level searches,
+    # counting the same-kind brackets skipped over along the way
     if char in open_brackets:
         # Find closing bracket
         target = pairs[char]
         count = 1
-        for i in range(pos + 1, len(text)):
-            if text[i] == char:
-                count += 1
-            elif text[i] == target:
-                count -= 1
-                if count == 0:
-                    return i
+        i = pos + 1
+        while True:
+            j = text.find(target, i)
+            if j < 0:
+                break
+            count += text.count(char, i, j) - 1
+            if count == 0:
+                return j
+            i = j + 1
     elif char in close_brackets:
         # Find opening bracket
         target = reverse_pairs[char]
         count = 1
-        for i in range(pos - 1, -1, -1):
-            if text[i] == char:
-                count += 1
-            elif text[i] == target:
-                count -= 1
-                if count == 0:
-                    return i
+        i = pos
+        while True:
+            j = text.rfind(target, 0, i)
+            if j < 0:
+                break
+            count += text.count(char, j + 1, i) - 1
+            if count == 0:
+                return j
+            i = j
     
     return None
 
@@ -152,15 +180,14 @@ def find_word_boundaries(text: str, pos: int) -> Tuple[int, int]:
     if pos >= len(text) or pos < 0:
         return pos, pos
     
-    # Find start of word
-    start = pos
-    while start > 0 and is_word_char(text[start - 1]):
-        start -= 1
+    # Find start of word by matching forward over the reversed text before
+    # pos, a single linear scan. A newline ends any word, so only the
+    # current line is reversed.
+    line_start = text.rfind('\n', 0, pos) + 1
+    start = pos - _WORD_RE.match(text[line_start:pos][::-1]).end()
     
     # Find end of word
-    end = pos
-    while end < len(text) and is_word_char(text[end]):
-        end += 1
+    end = _WORD_RE.match(text, pos).end()
     
     return start, end
 
@@ -172,43 +199,62 @@ def escape_regex(text: str) -> str:
     return re.escape(text)
 
 
-def find_all_occurrences(text: str, search: str, case_sensitive: bool = True) -> List[Tuple[int, int]]:
+def find_all_literal(text: str, needle: str, case_sensitive: bool = True) -> List[Tuple[int, int]]:
     """
-    Find all occurrences of search string in text
+    Find all non-overlapping occurrences of a literal string in text
     Returns list of (start, end) positions
     """
-    if not search:
+    if not needle:
         return []
     
-    flags = 0 if case_sensitive else re.IGNORECASE
-    pattern = escape_regex(search)
+    if not case_sensitive:
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # Some characters lower to several, so offsets into the lowered
+            # text would not line up with the original
+            pattern = escape_regex(needle)
+            return [match.span() for match in re.finditer(pattern, text, re.IGNORECASE)]
+        text = lowered
+        needle = needle.lower()
     
+    # str.find scans in C, without escaping or compiling a pattern
     matches = []
-    for match in re.finditer(pattern, text, flags):
-        matches.append((match.start(), match.end()))
+    size = len(needle)
+    pos = text.find(needle)
+    while pos >= 0:
+        matches.append((pos, pos + size))
+        pos = text.find(needle, pos + size)
     
     return matches
 
 
-def format_file_size(size_bytes: int) -> str:
+def find_all_occurrences(text: str, search: str, case_sensitive: bool = True,
+                         is_regex: bool = False) -> List[Tuple[int, int]]:
     """
-    Format file size in human readable format
+    Find all occurrences of search string in text, treating it as a
+    regular expression if is_regex is set
+    Returns list of (start, end) positions
     """
-    if size_bytes == 0:
-        return "0 B"
+    if not search:
+        return []
     
-    units = ["B", "KB", "MB", "GB", "TB"]
-    unit_index = 0
-    size = float(size_bytes)
+    if not is_regex:
+        return find_all_literal(text, search, case_sensitive)
     
-    while size >= 1024 and unit_index < len(units) - 1:
-        size /= 1024
-        unit_index += 1
+    flags = 0 if case_sensitive else re.IGNORECASE
+    return [match.span() for match in re.finditer(search, text, flags)]
+
+
+def format_file_size(size_bytes: int) -> str:
+    """
+    Format file size in human readable format
+    """
+    if size_bytes < 1024:
+        return f"{size_bytes} B"
     
-    if unit_index == 0:
-        return f"{int(size)} {units[unit_index]}"
-    else:
-        return f"{size:.1f} {units[unit_index]}"
+    # Each unit is 10 more bits, so the bit length picks the unit directly
+    unit_index = min((size_bytes.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (unit_index * 10)):.1f} {_SIZE_UNITS[unit_index]}"
 
 
 def truncate_string(text: str, max_length: int, ellipsis: str = "...") -> str:
@@ -235,7 +281,8 @@ def get_line_and_column_from_index(text: str, index: int) -> Tuple[int, int]:
     if index < 0 or index > len(text):
         return 0, 0
     
-    line = text[:index].count('\n')
+    # Bounded count avoids copying the text before the index
+    line = text.count('\n', 0, index)
     if line == 0:
         column = index
     else:
@@ -245,19 +292,81 @@ def get_line_and_column_from_index(text: str, index: int) -> Tuple[int, int]:
     return line, column
 
 
+def build_line_index(text: str) -> array:
+    """
+    Build a sorted array of the positions of every newline in text
+    Used to convert many indices without rescanning the text each time
+    """
+    line_index = array('q')
+    pos = text.find('\n')
+    while pos >= 0:
+        line_index.append(pos)
+        pos = text.find('\n', pos + 1)
+    return line_index
+
+
+def get_line_and_column_from_line_index(line_index: array, index: int) -> Tuple[int, int]:
+    """
+    Convert character index to line and column numbers (0-based)
+    using a newline array from build_line_index
+    """
+    if index < 0:
+        return 0, 0
+    
+    line = bisect_left(line_index, index)
+    if line == 0:
+        return 0, index
+    return line, index - line_index[line - 1] - 1
+
+
 def get_index_from_line_and_column(text: str, line: int, column: int) -> int:
     """
     Convert line and column numbers to character index
     """
-    lines = text.splitlines(keepends=True)
-    
-    if line < 0 or line >= len(lines):
+    if line < 0:
         return len(text)
     
-    index = sum(len(lines[i]) for i in range(line))
+    # Hop from newline to newline instead of splitting the whole text
+    start = 0
+    for _ in range(line):
+        start = text.find('\n', start) + 1
+        if start == 0:
+            return len(text)
     
-    if column >= 0:
-        line_text = lines[line].rstrip('\n\r')
-        index += min(column, len(line_text))
+    end = text.find('\n', start)
+    return _clamp_column(text, start, len(text) if end < 0 else end, column)
+
+
+def get_index_from_line_index(text: str, line_index: array, line: int, column: int) -> int:
+    """
+    Convert line and column numbers to character index
+    using a newline array from build_line_index
+    """
+    if line < 0 or line > len(line_index):
+        return len(text)
     
-    return index
+    start = line_index[line - 1] + 1 if line else 0
+    end = line_index[line] if line < len(line_index) else len(text)
+    return _clamp_column(text, start, end, column)
+
+
+def _clamp_column(text: str, start: int, end: int, column: int) -> int:
+    """Offset start by column, staying within the line (before any \\r)"""
+    if column < 0:
+        return start
+    if end > start and text[end - 1] == '\r':
+        end -= 1
+    return start + min(column, end - start)
+
+
+# Compiled versions of the character-level helpers, present when the
+# package was built with Cython; the definitions above are the fallback.
+# Replacing those definitions is the point, hence the F811 suppressions.
+try:
+    from . import _utils_fast
+except ImportError:
+    pass
+else:
+    find_matching_bracket = _utils_fast.find_matching_bracket  # noqa: F811
+    find_word_boundaries = _utils_fast.find_word_boundaries  # noqa: F811
+    wrap_text = _utils_fast.wrap_text  # noqa: F811
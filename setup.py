@@ -3,7 +3,7 @@
 Setup script for RetroEdit
 """
 
-from setuptools import setup, find_packages
+from setuptools import Extension, setup, find_packages
 from pathlib import Path
 
 # Read the README file
@@ -21,6 +21,19 @@ if REQUIREMENTS_PATH.exists():
             if line.strip() and not line.startswith('#')
         ]
 
+# Compile the optional text utility accelerator when Cython is installed.
+# The extension is optional, so a failed compile (no C compiler) still
+# installs the package with the pure Python utilities.
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize(
+        [Extension("retroedit._utils_fast", ["retroedit/_utils_fast.pyx"], optional=True)],
+        quiet=True,
+    )
+
 setup(
     name="retroedit",
     version="1.0.0",
@@ -31,6 +44,7 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/example/retroedit",
     packages=find_packages(),
+    ext_modules=ext_modules,
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -46,6 +60,12 @@ setup(
     ],
     python_requires=">=3.10",
     install_requires=requirements,
+    extras_require={
+        # C encoding detector, used in place of chardet when installed, and
+        # Rust versions of Textual's geometry types (set TEXTUAL_SPEEDUPS=0
+        # to turn them off)
+        "fast": ["faust-cchardet>=2.1.19", "textual-speedups>=0.2.1"],
+    },
     entry_points={
         "console_scripts": [
             "retroedit=retroedit.main:main",
@@ -53,7 +73,7 @@ setup(
         ],
     },
     package_data={
-        "retroedit": ["*.tcss"],
+        "retroedit": ["retroedit.tcss"],
     },
     include_package_data=True,
 )
@@ -7,7 +7,9 @@ import unittest
 from pathlib import Path
 import tempfile
 import os
+from unittest import mock
 
+from retroedit import fileio
 from retroedit.editor import TextBuffer
 from retroedit.config import config
 
@@ -35,6 +37,23 @@ class TestTextBuffer(unittest.TestCase):
         self.assertEqual(self.buffer.get_cursor_position(), (0, 2))
         self.assertTrue(self.buffer.modified)
     
+    def test_insert_text(self):
+        """Test batched text insertion"""
+        self.buffer.insert_text("Hello")
+        self.buffer.set_cursor_position(0, 2)
+        self.buffer.insert_text("ab\ncd")
+        
+        self.assertEqual(self.buffer.get_line_count(), 2)
+        self.assertEqual(self.buffer.get_line(0), "Heab")
+        self.assertEqual(self.buffer.get_line(1), "cdllo")
+        self.assertEqual(self.buffer.get_cursor_position(), (1, 2))
+        
+        # Each insert_text call is a single undo step
+        self.buffer.undo()
+        self.assertEqual(self.buffer.lines, ["Hello"])
+        self.buffer.undo()
+        self.assertEqual(self.buffer.lines, [""])
+    
     def test_insert_newline(self):
         """Test newline insertion"""
         self.buffer.insert_char('H')
@@ -86,6 +105,44 @@ class TestTextBuffer(unittest.TestCase):
         # Check state after redo
         self.assertEqual(self.buffer.get_line(0), "Hi")
     
+    def test_undo_redo_multiline(self):
+        """Test undo/redo of edits that add and remove lines"""
+        self.buffer.insert_text("one\ntwo\nthree")
+        self.buffer.set_cursor_position(1, 0)
+        self.buffer.insert_newline()
+        self.buffer.set_cursor_position(0, 3)
+        self.buffer.delete_char()
+        self.assertEqual(self.buffer.lines, ["one", "two", "three"])
+        
+        self.buffer.undo()
+        self.assertEqual(self.buffer.lines, ["one", "", "two", "three"])
+        self.assertEqual(self.buffer.get_cursor_position(), (0, 3))
+        self.buffer.undo()
+        self.assertEqual(self.buffer.lines, ["one", "two", "three"])
+        self.buffer.undo()
+        self.assertEqual(self.buffer.lines, [""])
+        
+        self.buffer.redo()
+        self.buffer.redo()
+        self.assertEqual(self.buffer.lines, ["one", "", "two", "three"])
+    
+    def test_undo_after_lines_replaced(self):
+        """Test undo stays consistent when the line list is replaced wholesale"""
+        self.buffer.lines = ["a", "b", "c", "d"]
+        self.buffer.set_cursor_position(3, 1)
+        self.buffer.insert_text("X")
+        
+        # As when the editor widget syncs its content into the buffer
+        self.buffer.lines = ["only"]
+        
+        self.assertTrue(self.buffer.undo())
+        self.assertEqual(self.buffer.lines, ["a", "b", "c", "dX"])
+        self.assertTrue(self.buffer.undo())
+        self.assertEqual(self.buffer.lines, ["a", "b", "c", "d"])
+        self.assertTrue(self.buffer.redo())
+        self.assertTrue(self.buffer.redo())
+        self.assertEqual(self.buffer.lines, ["only"])
+    
     def test_cursor_movement(self):
         """Test cursor movement"""
         self.buffer.insert_char('H')
@@ -102,6 +159,45 @@ class TestTextBuffer(unittest.TestCase):
         self.buffer.move_cursor(0, -10)
         self.assertEqual(self.buffer.get_cursor_position(), (0, 0))
     
+    def test_find_text(self):
+        """Test find with wrap-around and case folding"""
+        self.buffer.lines = ["alpha beta", "Gamma beta", "delta"]
+        
+        self.assertEqual(self.buffer.find_text("beta", (0, 7)), (1, 6))
+        self.assertEqual(self.buffer.find_text("alpha", (1, 0)), (0, 0))
+        self.assertIsNone(self.buffer.find_text("gamma"))
+        self.assertEqual(self.buffer.find_text("gamma", case_sensitive=False), (1, 0))
+    
+    def test_find_after_edit(self):
+        """Test a miss is not remembered once the text is typed"""
+        self.buffer.lines = ["abc"]
+        self.assertIsNone(self.buffer.find_text("xyz"))
+        
+        self.buffer.set_cursor_position(0, 3)
+        self.buffer.insert_text("xyz")
+        self.assertEqual(self.buffer.find_text("xyz", (0, 0)), (0, 3))
+        
+        self.buffer.undo()
+        self.assertIsNone(self.buffer.find_text("xyz"))
+    
+    def test_find_after_lines_replaced(self):
+        """Test a repeated miss is not remembered once the line list is replaced"""
+        self.buffer.lines = ["abc"]
+        self.assertIsNone(self.buffer.find_text("xyz"))
+        self.assertIsNone(self.buffer.find_text("xyz"))
+        
+        # As when the editor widget syncs its content into the buffer
+        self.buffer.lines = ["abc", "xyz"]
+        self.assertEqual(self.buffer.find_text("xyz", (0, 0)), (1, 0))
+    
+    def test_replace_all(self):
+        """Test replace all reports the number of replacements"""
+        self.buffer.lines = ["one two one", "two", "one"]
+        
+        self.assertEqual(self.buffer.replace_text("one", "1", replace_all=True), 3)
+        self.assertEqual(self.buffer.lines, ["1 two 1", "two", "1"])
+        self.assertEqual(self.buffer.replace_text("one", "1", replace_all=True), 0)
+    
     def test_file_operations(self):
         """Test file loading and saving"""
         # Create a temporary file
@@ -132,6 +228,20 @@ class TestTextBuffer(unittest.TestCase):
             # Clean up
             if temp_path.exists():
                 os.unlink(temp_path)
+    
+    def test_load_line_endings(self):
+        """Test mixed line endings split correctly across read chunks"""
+        with tempfile.NamedTemporaryFile(mode='wb', delete=False, suffix='.txt') as f:
+            f.write(b"ab\r\ncd\ref\n\r\n" + b"x" * 7 + b"\r")
+            temp_path = Path(f.name)
+        
+        try:
+            for chunk_size in (1, 2, 3, 5, 64 * 1024):
+                with mock.patch.object(fileio, 'LOAD_CHUNK_SIZE', chunk_size):
+                    self.buffer.load_file(temp_path)
+                self.assertEqual(self.buffer.lines, ["ab", "cd", "ef", "", "x" * 7])
+        finally:
+            os.unlink(temp_path)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Tests for RetroEdit text search
+"""
+
+import unittest
+
+from retroedit.search import BMHSearcher
+
+
+class TestBMHSearcher(unittest.TestCase):
+    """Test cases for BMHSearcher class"""
+    
+    def test_case_sensitive(self):
+        """Test case-sensitive search matches str.find"""
+        searcher = BMHSearcher("lo")
+        self.assertEqual(searcher.find("hello world"), 3)
+        self.assertEqual(searcher.find("hello world", 4), -1)
+        self.assertEqual(searcher.find("HELLO"), -1)
+    
+    def test_case_insensitive(self):
+        """Test case-insensitive search"""
+        searcher = BMHSearcher("WoRlD", case_sensitive=False)
+        self.assertEqual(searcher.find("Hello world"), 6)
+        self.assertEqual(searcher.find("WORLD world", 1), 6)
+        self.assertEqual(searcher.find("Hello world", 0, 10), -1)
+        self.assertEqual(searcher.find("no match here"), -1)
+    
+    def test_replace_in_line(self):
+        """Test replacing all matches counts them in one pass"""
+        searcher = BMHSearcher("ab")
+        self.assertEqual(searcher.replace_in_line("abcabab", "X"), ("XcXX", 3))
+        self.assertEqual(searcher.replace_in_line("nothing", "X"), ("nothing", 0))
+        
+        searcher = BMHSearcher("ab", case_sensitive=False)
+        self.assertEqual(searcher.replace_in_line("Ab-aB-ab", "x"), ("x-x-x", 3))
+    
+    def test_matches_str_find(self):
+        """Test case-insensitive scan agrees with lowered str.find"""
+        text = "the quick brown fox jumps over the lazy dog; THE END"
+        for pattern in ["the", "Fox", "z", "dog; t", "end", "xyz", "e"]:
+            searcher = BMHSearcher(pattern, case_sensitive=False)
+            for start in range(0, len(text), 7):
+                self.assertEqual(
+                    searcher.find(text, start),
+                    text.lower().find(pattern.lower(), start),
+                    (pattern, start)
+                )
+    
+    def test_replace_empty_pattern(self):
+        """Test an empty pattern replaces nothing"""
+        for case_sensitive in (True, False):
+            searcher = BMHSearcher("", case_sensitive)
+            self.assertEqual(searcher.replace_in_line("abc", "x"), ("abc", 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
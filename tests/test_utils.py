@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Tests for RetroEdit utility functions
+"""
+
+import unittest
+
+from retroedit import utils
+
+
+class TestWrapText(unittest.TestCase):
+    """Test cases for wrap_text"""
+    
+    def test_short_lines_unchanged(self):
+        """Test lines within the width are kept as they are"""
+        self.assertEqual(utils.wrap_text("", 10), [""])
+        self.assertEqual(utils.wrap_text("one\ntwo", 10), ["one", "two"])
+    
+    def test_word_boundaries(self):
+        """Test long lines break between words"""
+        self.assertEqual(
+            utils.wrap_text("the quick brown fox jumps", 10),
+            ["the quick", "brown fox", "jumps"],
+        )
+    
+    def test_long_words_are_split(self):
+        """Test words longer than the width are broken into pieces"""
+        self.assertEqual(utils.wrap_text("abcdefghij", 4), ["abcd", "efgh", "ij"])
+        self.assertEqual(utils.wrap_text("abcdefgh x", 4), ["abcd", "efgh", "x"])
+        self.assertEqual(utils.wrap_text("ab abcdefghij", 4), ["ab", "abcd", "efgh", "ij"])
+
+
+class TestFindAllOccurrences(unittest.TestCase):
+    """Test cases for find_all_occurrences"""
+    
+    def test_case_sensitive(self):
+        """Test matches are non-overlapping (start, end) spans"""
+        self.assertEqual(utils.find_all_occurrences("aaaa", "aa"), [(0, 2), (2, 4)])
+        self.assertEqual(utils.find_all_occurrences("Foo foo", "foo"), [(4, 7)])
+        self.assertEqual(utils.find_all_occurrences("foo", ""), [])
+    
+    def test_case_insensitive(self):
+        """Test case-insensitive matches report offsets into the original text"""
+        self.assertEqual(
+            utils.find_all_occurrences("Foo fOO", "foo", case_sensitive=False),
+            [(0, 3), (4, 7)],
+        )
+        self.assertEqual(
+            utils.find_all_occurrences("\u0130 Foo", "foo", case_sensitive=False),
+            [(2, 5)],
+        )
+    
+    def test_regex(self):
+        """Test patterns are only interpreted when is_regex is set"""
+        self.assertEqual(utils.find_all_occurrences("a1 b22", r"\d+"), [])
+        self.assertEqual(utils.find_all_occurrences("a1 b22", r"\d+", is_regex=True), [(1, 2), (4, 6)])
+        self.assertEqual(utils.find_all_literal("a.b a.b", "a.b"), [(0, 3), (4, 7)])
+
+
+class TestFindMatchingBracket(unittest.TestCase):
+    """Test cases for find_matching_bracket"""
+    
+    def test_forward(self):
+        """Test an opening bracket finds its closing partner"""
+        text = "f(a, (b), [c]) + (d"
+        self.assertEqual(utils.find_matching_bracket(text, 1), 13)
+        self.assertEqual(utils.find_matching_bracket(text, 5), 7)
+        self.assertIsNone(utils.find_matching_bracket(text, 17))
+    
+    def test_backward(self):
+        """Test a closing bracket finds its opening partner"""
+        text = "{a: {b: [1]}} }"
+        self.assertEqual(utils.find_matching_bracket(text, 12), 0)
+        self.assertEqual(utils.find_matching_bracket(text, 10), 8)
+        self.assertIsNone(utils.find_matching_bracket(text, 14))
+        self.assertIsNone(utils.find_matching_bracket(text, 1))
+
+
+class TestLineIndex(unittest.TestCase):
+    """Test cases for index and line/column conversions"""
+    
+    def test_line_and_column(self):
+        """Test both conversions agree for every index"""
+        text = "ab\n\ncde\nf"
+        line_index = utils.build_line_index(text)
+        self.assertEqual(list(line_index), [2, 3, 7])
+        for index in range(len(text) + 1):
+            self.assertEqual(
+                utils.get_line_and_column_from_line_index(line_index, index),
+                utils.get_line_and_column_from_index(text, index),
+            )
+        self.assertEqual(utils.get_line_and_column_from_index(text, 5), (2, 1))
+    
+    def test_index_from_line_and_column(self):
+        """Test column clamping and out-of-range lines"""
+        text = "ab\r\ncde\n"
+        line_index = utils.build_line_index(text)
+        for line, column, expected in [
+            (0, 1, 1), (0, 9, 2), (1, 2, 6), (1, -1, 4), (2, 0, 8), (3, 0, 8), (-1, 0, 8),
+        ]:
+            self.assertEqual(utils.get_index_from_line_and_column(text, line, column), expected)
+            self.assertEqual(utils.get_index_from_line_index(text, line_index, line, column), expected)
+
+
+class TestIndentation(unittest.TestCase):
+    """Test cases for indentation helpers"""
+    
+    def test_leading_whitespace(self):
+        """Test only leading spaces and tabs are counted"""
+        self.assertEqual(utils.count_leading_whitespace(" \t x "), 3)
+        self.assertEqual(utils.count_leading_whitespace("x"), 0)
+        self.assertEqual(utils.count_leading_whitespace("   "), 3)
+    
+    def test_indentation(self):
+        """Test tabs expand to tab_size spaces"""
+        self.assertEqual(utils.get_indentation("\t  if x:", 4), "      ")
+        self.assertEqual(utils.get_indentation("\tx", 2), "  ")
+        self.assertEqual(utils.get_indentation("x"), "")
+
+
+class TestFindWordBoundaries(unittest.TestCase):
+    """Test cases for find_word_boundaries"""
+    
+    def test_boundaries(self):
+        """Test words include letters, digits and underscores"""
+        text = "foo bar_2(x)\nbaz"
+        self.assertEqual(utils.find_word_boundaries(text, 5), (4, 9))
+        self.assertEqual(utils.find_word_boundaries(text, 9), (4, 9))
+        self.assertEqual(utils.find_word_boundaries(text, 3), (0, 3))
+        self.assertEqual(utils.find_word_boundaries(text, 13), (13, 16))
+        self.assertEqual(utils.find_word_boundaries(text, 16), (16, 16))
+
+
+class TestNormalizeLineEndings(unittest.TestCase):
+    """Test cases for normalize_line_endings"""
+    
+    def test_dense_and_sparse(self):
+        """Test CRLF and lone CR convert whether they are common or rare"""
+        self.assertEqual(utils.normalize_line_endings("a\r\nb\rc\n"), "a\nb\nc\n")
+        sparse = "x" * 200 + "\r\n" + "y" * 200 + "\r"
+        self.assertEqual(utils.normalize_line_endings(sparse), "x" * 200 + "\n" + "y" * 200 + "\n")
+    
+    def test_target_ending(self):
+        """Test all endings convert to the requested one"""
+        self.assertEqual(utils.normalize_line_endings("a\r\nb\rc\n", "\r\n"), "a\r\nb\r\nc\r\n")
+        self.assertEqual(utils.normalize_line_endings("", "\r\n"), "")
+
+
+class TestFormatFileSize(unittest.TestCase):
+    """Test cases for format_file_size"""
+    
+    def test_units(self):
+        """Test sizes pick the largest unit they reach"""
+        self.assertEqual(utils.format_file_size(0), "0 B")
+        self.assertEqual(utils.format_file_size(1023), "1023 B")
+        self.assertEqual(utils.format_file_size(1024), "1.0 KB")
+        self.assertEqual(utils.format_file_size(1536 * 1024), "1.5 MB")
+        self.assertEqual(utils.format_file_size(2048 << 40), "2048.0 TB")
+
+
+if __name__ == '__main__':
+    unittest.main()